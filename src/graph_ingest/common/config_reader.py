@@ -1,7 +1,7 @@
 import json
 import os
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import List, Optional, Union
 
 
 @dataclass
@@ -21,10 +21,20 @@ class PathsConfig:
     log_directory: str
 
 
+@dataclass
+class ProjectionConfig:
+    # GDS node/relationship projections: '*' for everything, or a list of labels/types
+    node_labels: Union[str, List[str]] = "*"
+    rel_types: Union[str, List[str]] = "*"
+    # Export the projection and its embeddings to CSV under the server's gds.export.location
+    export_csv: bool = False
+
+
 @dataclass
 class AppConfig:
     database: DatabaseConfig
     paths: PathsConfig
+    projection: ProjectionConfig = field(default_factory=ProjectionConfig)
 
 
 def load_config(config_path: Optional[str] = None) -> AppConfig:
@@ -47,5 +57,6 @@ def load_config(config_path: Optional[str] = None) -> AppConfig:
     # Construct the dataclass structure
     return AppConfig(
         database=DatabaseConfig(**raw_config['database']),
-        paths=PathsConfig(**raw_config['paths'])
+        paths=PathsConfig(**raw_config['paths']),
+        projection=ProjectionConfig(**raw_config.get('projection', {}))
     )
@@ -1,8 +1,11 @@
 import os
 import json
+import hashlib
+import threading
 import pandas as pd
 import requests
-from urllib.parse import quote
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from tqdm import tqdm
 import logging
 from datetime import datetime
@@ -10,10 +13,25 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 import multiprocessing
 from typing import Tuple, Dict, Any, List, Optional
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the standard library serializer
+    orjson = None
+
 # Import centralized configuration and logging functions
 from graph_ingest.common.config_reader import load_config, AppConfig
 from graph_ingest.common.logger_setup import setup_logger
 
+CMR_COLLECTIONS_URL = "https://cmr.earthdata.nasa.gov/search/collections.umm_json"
+# DOIs sent per bulk CMR search, and the largest page CMR will return
+BULK_CHUNK_SIZE = 200
+CMR_MAX_PAGE_SIZE = 2000
+# (connect, read) seconds, so a stalled CMR response cannot hang a worker thread
+CMR_REQUEST_TIMEOUT = (5, 30)
+# Sidecar index of already-saved DOIs. It sits beside the dataset metadata directory,
+# not inside it, so the ingestors walking that directory for .json files never read it.
+CACHE_INDEX_SUFFIX = "_cmr_cache_index.json"
+
 
 class MetadataFetcher:
     """Handles fetching, parsing, and saving dataset metadata from CMR API."""
@@ -27,6 +45,9 @@ class MetadataFetcher:
         """
         self.config = config
         self.base_dir = config.paths.dataset_metadata_directory
+        # Derived once here rather than rebuilt for every DOI
+        self._base_url = CMR_COLLECTIONS_URL
+        self._doi_trans = str.maketrans({"/": "_"})
         timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
         self.logger = setup_logger(
             __name__, 
@@ -35,6 +56,29 @@ class MetadataFetcher:
             file_level=logging.INFO
         )
         
+        # One worker thread per CPU, sharing a session whose connection pool has a
+        # slot per worker so TCP/TLS connections to CMR are reused across requests.
+        # Transient connection errors and throttling responses are retried with backoff.
+        self.num_threads: int = multiprocessing.cpu_count()
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.num_threads,
+            pool_maxsize=self.num_threads,
+            # Bulk searches are POSTs; they only read, so they are as safe to retry as GETs
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+            ),
+        )
+        self._session.mount("https://", adapter)
+        
+        # DOI -> {sha256, data_center, frequency, conflict} for files saved by earlier runs
+        self.cache_index_path = os.path.normpath(self.base_dir) + CACHE_INDEX_SUFFIX
+        self.cache_index: Dict[str, Dict[str, Any]] = self._load_cache_index()
+        self._cache_lock = threading.Lock()
+        
         # Statistics tracking
         self.success_count = 0
         self.failure_count = 0
@@ -83,7 +127,56 @@ class MetadataFetcher:
         frequency = long_name_frequency if long_name_frequency != "Unknown" else abstract_frequency
         return frequency, conflict
     
-    def save_metadata(self, doi: str, umm: Dict[str, Any], data_center: str) -> None:
+    def _load_cache_index(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the cache index written by a previous run, if there is one.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The index, or an empty dict if it is missing or unreadable.
+        """
+        if not os.path.exists(self.cache_index_path):
+            return {}
+        try:
+            with open(self.cache_index_path, "r") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.warning(f"Ignoring unreadable cache index {self.cache_index_path}: {e}")
+            return {}
+
+    def save_cache_index(self) -> None:
+        """Write the cache index next to the saved metadata so the next run can reuse it."""
+        os.makedirs(self.base_dir, exist_ok=True)
+        with open(self.cache_index_path, "w") as f:
+            json.dump(self.cache_index, f)
+
+    def _metadata_path(self, doi: str, data_center: str) -> str:
+        """Return the path the metadata for a DOI is saved to."""
+        return os.path.join(self.base_dir, data_center, f"{doi.translate(self._doi_trans)}.json")
+
+    def _cached_result(self, doi: str) -> Optional[Tuple[str, bool, bool, str, bool]]:
+        """
+        Return the result recorded for a DOI if its saved file is still intact.
+
+        Args:
+            doi (str): The DOI to look up.
+
+        Returns:
+            Optional[Tuple[str, bool, bool, str, bool]]: The process_doi tuple from the cache
+            index, or None if the DOI is not indexed or its file is missing or changed.
+        """
+        entry = self.cache_index.get(doi)
+        if not entry:
+            return None
+        try:
+            with open(self._metadata_path(doi, entry["data_center"]), "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return None
+        if digest != entry["sha256"]:
+            return None
+        return doi, True, True, entry["frequency"], entry["conflict"]
+    
+    def save_metadata(self, doi: str, umm: Dict[str, Any], data_center: str) -> str:
         """
         Save metadata to a JSON file in the appropriate directory.
         
@@ -91,19 +184,23 @@ class MetadataFetcher:
             doi (str): The DOI associated with the metadata.
             umm (Dict[str, Any]): The metadata to save.
             data_center (str): The data center short name for directory organization.
+
+        Returns:
+            str: The SHA-256 hex digest of the saved file's contents.
         """
         # Create a directory for the data center based on its ShortName
         center_dir = os.path.join(self.base_dir, data_center)
         os.makedirs(center_dir, exist_ok=True)
 
-        # Save metadata as JSON
-        filename = f"{doi.replace('/', '_')}.json"
-        filepath = os.path.join(center_dir, filename)
+        # Save metadata as JSON, serialized once so the same bytes are written and hashed
+        filepath = self._metadata_path(doi, data_center)
+        body = orjson.dumps(umm) if orjson is not None else json.dumps(umm).encode()
         
-        with open(filepath, "w") as f:
-            json.dump(umm, f)
+        with open(filepath, "wb") as f:
+            f.write(body)
             
         self.logger.info(f"Successfully saved metadata for DOI {doi} to {filepath}")
+        return hashlib.sha256(body).hexdigest()
 
     def fetch_metadata(self, doi: str) -> Optional[Dict[str, Any]]:
         """
@@ -116,23 +213,11 @@ class MetadataFetcher:
             Optional[Dict[str, Any]]: The metadata if successful, None otherwise.
         """
         try:
-            encoded_doi = quote(doi, safe="")
-            url = f"https://cmr.earthdata.nasa.gov/search/collections.umm_json?doi={encoded_doi}"
-            response = requests.get(url)
+            response = self._session.get(self._base_url, params={"doi": doi}, timeout=CMR_REQUEST_TIMEOUT)
             response.raise_for_status()
             
             if response.status_code == 200 and response.json().get("items"):
-                item = response.json()["items"][0]
-                umm = item.get("umm", {})
-                cmr_id = item.get("meta", {}).get("concept-id")
-                
-                if not cmr_id:
-                    self.logger.warning(f"Metadata retrieved but CMR ID is missing for DOI {doi}")
-                    return None
-                
-                if umm:
-                    umm['CMR_ID'] = cmr_id
-                    return umm
+                return self._umm_with_cmr_id(doi, response.json()["items"][0])
                     
             self.logger.error(
                 f"Failed to fetch metadata for DOI {doi}, response status: {response.status_code}"
@@ -143,12 +228,108 @@ class MetadataFetcher:
             self.logger.error(f"Error fetching metadata for DOI {doi}: {e}")
             return None
 
-    def process_doi(self, doi: str) -> Tuple[str, bool, bool, str, bool]:
+    def _umm_with_cmr_id(self, doi: str, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Pull the UMM metadata out of a CMR search item and tag it with the item's CMR ID.
+
+        Args:
+            doi (str): The DOI the item was fetched for.
+            item (Dict[str, Any]): One entry of a CMR search response's "items".
+
+        Returns:
+            Optional[Dict[str, Any]]: The metadata with 'CMR_ID' set, or None if either is missing.
+        """
+        umm = item.get("umm", {})
+        cmr_id = item.get("meta", {}).get("concept-id")
+
+        if not cmr_id:
+            self.logger.warning(f"Metadata retrieved but CMR ID is missing for DOI {doi}")
+            return None
+
+        if not umm:
+            self.logger.error(f"Failed to fetch metadata for DOI {doi}, CMR record has no UMM")
+            return None
+
+        umm['CMR_ID'] = cmr_id
+        return umm
+
+    def fetch_metadata_bulk(self, dois: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch metadata for many DOIs with one CMR search per chunk of BULK_CHUNK_SIZE DOIs.
+
+        Args:
+            dois (List[str]): The DOIs to fetch metadata for.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Metadata keyed by the input DOI. DOIs with no
+            usable CMR record are left out.
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(dois), BULK_CHUNK_SIZE):
+            chunk = dois[start:start + BULK_CHUNK_SIZE]
+            try:
+                # CMR may return a DOI in a different case than the source list
+                requested = {doi.lower(): doi for doi in chunk}
+                params = [("doi[]", doi) for doi in chunk] + [("page_size", CMR_MAX_PAGE_SIZE)]
+                # Form-encoded POST: a chunk of DOIs as GET query parameters can exceed URL length limits
+                response = self._session.post(self._base_url, data=params, timeout=CMR_REQUEST_TIMEOUT)
+                response.raise_for_status()
+                items = response.json().get("items", [])
+            except Exception as e:
+                self.logger.error(f"Error fetching metadata for {len(chunk)} DOIs starting at {chunk[0]}: {e}")
+                continue
+
+            for item in items:
+                returned_doi = item.get("umm", {}).get("DOI", {}).get("DOI", "")
+                doi = requested.get(returned_doi.lower())
+                # Keep the first record per DOI, as fetch_metadata does
+                if doi is None or doi in found:
+                    continue
+                umm = self._umm_with_cmr_id(doi, item)
+                if umm:
+                    found[doi] = umm
+        return found
+
+    def _save_processed(self, doi: str, umm: Dict[str, Any]) -> Tuple[str, bool, bool, str, bool]:
+        """
+        Extract frequency info from fetched metadata, save it, and build the result tuple.
+
+        Args:
+            doi (str): The DOI the metadata belongs to.
+            umm (Dict[str, Any]): The fetched metadata.
+
+        Returns:
+            Tuple[str, bool, bool, str, bool]: The same tuple process_doi returns on success.
+        """
+        # Extract frequency info
+        frequency, conflict = self.extract_frequency(umm)
+        umm['Frequency'] = frequency
+        
+        # Get data center info for file organization
+        data_center = umm.get("DataCenters", [{}])[0].get("ShortName", "Unknown")
+        
+        # Save the metadata and record it so later runs can skip the fetch
+        digest = self.save_metadata(doi, umm, data_center)
+        with self._cache_lock:
+            self.cache_index[doi] = {
+                "sha256": digest,
+                "data_center": data_center,
+                "frequency": frequency,
+                "conflict": conflict,
+            }
+        
+        return doi, True, True, frequency, conflict
+
+    def process_doi(self, doi: str, force_refresh: bool = False) -> Tuple[str, bool, bool, str, bool]:
         """
         Process a single DOI: fetch metadata, extract frequency, and save results.
 
+        A DOI whose saved file still matches the cache index is returned from the
+        index without contacting CMR.
+
         Args:
             doi (str): The DOI to process.
+            force_refresh (bool): Fetch from CMR even if the DOI is cached.
 
         Returns:
             Tuple[str, bool, bool, str, bool]: A tuple containing:
@@ -158,54 +339,94 @@ class MetadataFetcher:
                 - frequency: Extracted frequency ("Unknown" if not found).
                 - conflict_flag: Whether there was a frequency conflict.
         """
+        cached = None if force_refresh else self._cached_result(doi)
+        if cached:
+            return cached
+        
         umm = self.fetch_metadata(doi)
         
         if not umm:
             return doi, False, False, "Unknown", False
             
-        # Extract frequency info
-        frequency, conflict = self.extract_frequency(umm)
-        umm['Frequency'] = frequency
-        
-        # Get data center info for file organization
-        data_center = umm.get("DataCenters", [{}])[0].get("ShortName", "Unknown")
-        
-        # Save the metadata
-        self.save_metadata(doi, umm, data_center)
-        
-        return doi, True, True, frequency, conflict
+        return self._save_processed(doi, umm)
 
-    def run(self) -> None:
+    def process_dois(self, dois: List[str], force_refresh: bool = False) -> List[Tuple[str, bool, bool, str, bool]]:
+        """
+        Process many DOIs with bulk CMR searches instead of one request per DOI.
+
+        DOIs whose saved files still match the cache index are not fetched again.
+
+        Args:
+            dois (List[str]): The DOIs to process.
+            force_refresh (bool): Fetch every DOI from CMR, ignoring the cache.
+
+        Returns:
+            List[Tuple[str, bool, bool, str, bool]]: One process_doi-style tuple per input
+            DOI, in input order. Blank or non-string DOIs and DOIs that CMR did not
+            return are reported as failures.
+        """
+        # Blank cells in the source CSV arrive as float NaN; they are reported as
+        # failures instead of being sent to CMR
+        valid = [doi for doi in dois if isinstance(doi, str) and doi.strip()]
+        if len(valid) < len(dois):
+            self.logger.error(f"Skipping {len(dois) - len(valid)} blank or non-string DOIs")
+
+        cached = {}
+        if not force_refresh:
+            for doi in valid:
+                result = self._cached_result(doi)
+                if result:
+                    cached[doi] = result
+
+        to_fetch = [doi for doi in valid if doi not in cached]
+        found = self.fetch_metadata_bulk(to_fetch) if to_fetch else {}
+
+        results = []
+        for doi in dois:
+            if not isinstance(doi, str):
+                results.append((doi, False, False, "Unknown", False))
+            elif doi in cached:
+                results.append(cached[doi])
+            elif doi in found:
+                results.append(self._save_processed(doi, found[doi]))
+            else:
+                results.append((doi, False, False, "Unknown", False))
+        return results
+
+    def run(self, force_refresh: bool = False) -> None:
         """
         Fetch, process, and save metadata for all DOIs in the source file.
         Reports summary statistics upon completion.
+
+        Args:
+            force_refresh (bool): Re-fetch DOIs that are already in the cache index.
         """
         # Load the DOIs from the CSV file
         df: pd.DataFrame = self.load_dataframe()
 
-        # Determine the number of threads to use for parallel downloads
-        num_threads: int = multiprocessing.cpu_count()
-        self.logger.info(f"Starting download with {num_threads} parallel threads")
+        self.logger.info(f"Starting download with {self.num_threads} parallel threads")
 
-        with ThreadPoolExecutor(max_workers=num_threads) as executor:
-            future_to_doi = {
-                executor.submit(self.process_doi, doi): doi for doi in df["DOI_NAME"]
-            }
+        # Each worker handles one bulk CMR search rather than a single DOI
+        dois: List[str] = list(df["DOI_NAME"])
+        chunks = [dois[i:i + BULK_CHUNK_SIZE] for i in range(0, len(dois), BULK_CHUNK_SIZE)]
+
+        with ThreadPoolExecutor(max_workers=self.num_threads) as executor:
+            futures = [executor.submit(self.process_dois, chunk, force_refresh) for chunk in chunks]
             
-            for future in tqdm(as_completed(future_to_doi), total=len(df), desc="Downloading Metadata"):
-                doi, success, has_cmr_id, frequency, conflict = future.result()
-                
-                if success:
-                    self.success_count += 1
-                    if not has_cmr_id:
-                        self.missing_cmr_id_count += 1
-                    if frequency == "Unknown":
-                        self.unknown_frequency_count += 1
-                    if conflict:
-                        self.conflict_count += 1
-                else:
-                    self.failure_count += 1
+            for future in tqdm(as_completed(futures), total=len(chunks), desc="Downloading Metadata"):
+                for doi, success, has_cmr_id, frequency, conflict in future.result():
+                    if success:
+                        self.success_count += 1
+                        if not has_cmr_id:
+                            self.missing_cmr_id_count += 1
+                        if frequency == "Unknown":
+                            self.unknown_frequency_count += 1
+                        if conflict:
+                            self.conflict_count += 1
+                    else:
+                        self.failure_count += 1
 
+        self.save_cache_index()
         self._report_statistics()
         
     def _report_statistics(self) -> None:
@@ -1,11 +1,48 @@
 import logging
+from datetime import datetime
 from typing import Any
 from neo4j import GraphDatabase
+from neo4j.exceptions import Neo4jError
 
 from graph_ingest.common.config_reader import load_config, AppConfig  # Updated import
 from graph_ingest.common.logger_setup import setup_logger
 from graph_ingest.common.dbconfig import get_driver
 
+# Cypher for each FastRP step, built once at import
+_Q_EXISTS = "CALL gds.graph.exists('graphEmbedding') YIELD exists RETURN exists"
+_Q_DROP = "CALL gds.graph.drop('graphEmbedding') YIELD graphName"
+_Q_PROJECT = """
+        CALL gds.graph.project(
+            'graphEmbedding',
+            $node_labels,   // '*' or a list of node labels
+            $rel_types      // '*' or a list of relationship types
+        )
+        YIELD graphName, nodeCount, relationshipCount
+        """
+_Q_FASTRP = """
+        CALL gds.fastRP.write('graphEmbedding', {
+            embeddingDimension: 512,
+            iterationWeights: [0.8, 1.0, 1.0, 1.0],
+            nodeSelfInfluence: 1.0,
+            writeProperty: 'fastrp_embedding_with_labels'
+        })
+        YIELD nodePropertiesWritten
+        """
+# Optional server-side CSV dump of the projection and the written embeddings, for use
+# outside Neo4j; files land under the server's gds.export.location
+_Q_EXPORT_CSV = """
+        CALL gds.beta.graph.export.csv('graphEmbedding', {
+            exportName: $export_name,
+            additionalNodeProperties: ['fastrp_embedding_with_labels']
+        })
+        YIELD exportName, nodeCount
+        """
+_Q_EMBEDDING_STATS = """
+        MATCH (n)
+        WHERE n.fastrp_embedding_with_labels IS NOT NULL
+        RETURN count(n) AS embedding_nodes
+        """
+
 
 class FastRPProcessor:
     """
@@ -30,25 +67,19 @@ class FastRPProcessor:
         self.driver = get_driver()
 
     def _drop_existing_projection(self, tx: Any) -> None:
-        query = "CALL gds.graph.exists('graphEmbedding') YIELD exists RETURN exists"
-        result = tx.run(query).single()
+        result = tx.run(_Q_EXISTS).single()
         if result and result["exists"]:
-            drop_query = "CALL gds.graph.drop('graphEmbedding') YIELD graphName"
-            tx.run(drop_query)
+            tx.run(_Q_DROP)
             self.logger.info("Existing graph projection 'graphEmbedding' dropped.")
         else:
             self.logger.info("No existing graph projection found to drop.")
 
     def _create_graph_projection(self, tx: Any) -> None:
-        query = """
-        CALL gds.graph.project(
-            'graphEmbedding',
-            '*',   // Include all node labels
-            '*'    // Include all relationship types
-        )
-        YIELD graphName, nodeCount, relationshipCount
-        """
-        result = tx.run(query).single()
+        # Projecting only what FastRP needs keeps the in-memory graph small
+        projection = self.config.projection
+        result = tx.run(
+            _Q_PROJECT, node_labels=projection.node_labels, rel_types=projection.rel_types
+        ).single()
         if result:
             self.logger.info(
                 f"Graph projection created: {result['graphName']} "
@@ -58,36 +89,32 @@ class FastRPProcessor:
             self.logger.error("Failed to create graph projection.")
 
     def _run_fastrp(self, tx: Any) -> None:
-        query = """
-        CALL gds.fastRP.write('graphEmbedding', {
-            embeddingDimension: 512,
-            iterationWeights: [0.8, 1.0, 1.0, 1.0],
-            nodeSelfInfluence: 1.0,
-            writeProperty: 'fastrp_embedding_with_labels'
-        })
-        YIELD nodePropertiesWritten
-        """
-        result = tx.run(query).single()
+        result = tx.run(_Q_FASTRP).single()
         if result:
             self.logger.info(f"FastRP embeddings written to {result['nodePropertiesWritten']} nodes.")
         else:
             self.logger.error("Failed to run FastRP or write embeddings.")
 
+    def _export_embeddings_to_csv(self, tx: Any) -> None:
+        # GDS refuses to overwrite an existing export, so each run gets its own name
+        export_name = f"fastrp_embeddings_{datetime.now():%Y%m%d_%H%M%S}"
+        result = tx.run(_Q_EXPORT_CSV, export_name=export_name).single()
+        if result:
+            self.logger.info(
+                f"FastRP embeddings exported to CSV '{result['exportName']}' for {result['nodeCount']} nodes."
+            )
+        else:
+            self.logger.error("Failed to export FastRP embeddings to CSV.")
+
     def _drop_graph_projection(self, tx: Any) -> None:
-        query = "CALL gds.graph.drop('graphEmbedding') YIELD graphName"
-        result = tx.run(query).single()
+        result = tx.run(_Q_DROP).single()
         if result:
             self.logger.info(f"Graph projection '{result['graphName']}' dropped.")
         else:
             self.logger.error("Failed to drop the graph projection.")
 
     def _get_embedding_stats(self, tx: Any) -> None:
-        query = """
-        MATCH (n)
-        WHERE n.fastrp_embedding_with_labels IS NOT NULL
-        RETURN count(n) AS embedding_nodes
-        """
-        result = tx.run(query).single()
+        result = tx.run(_Q_EMBEDDING_STATS).single()
         if result:
             count = result["embedding_nodes"]
             self.logger.info(f"Total nodes with FastRP embeddings: {count}")
@@ -107,6 +134,14 @@ class FastRPProcessor:
             self.logger.info("Running FastRP embeddings...")
             session.execute_write(self._run_fastrp)
 
+            if self.config.projection.export_csv:
+                self.logger.info("Exporting FastRP embeddings to CSV...")
+                try:
+                    session.execute_write(self._export_embeddings_to_csv)
+                except Neo4jError as e:
+                    # Export needs gds.export.location set on the server; the projection must still be dropped
+                    self.logger.error(f"Failed to export FastRP embeddings to CSV: {e}")
+
             self.logger.info("Fetching FastRP embedding stats...")
             session.execute_read(self._get_embedding_stats)
 
@@ -43,6 +43,10 @@ class DatasetProjectRelationshipIngestor:
             """
             tx.run(query, dataset_globalId=dataset_globalId, project_globalId=project_globalId)
 
+    def _load_json(self, json_file: str) -> Dict[str, Any]:
+        with open(json_file, "r") as file:
+            return json.load(file)
+
     def process_json_files(self, directory: str, batch_size: int = 100) -> None:
         relationships: List[Tuple[str, str]] = []
         json_files: List[str] = list(find_json_files(directory))
@@ -50,21 +54,20 @@ class DatasetProjectRelationshipIngestor:
 
         for json_file in tqdm(json_files, desc="Processing JSON files", unit="file"):
             try:
-                with open(json_file, "r") as file:
-                    data = json.load(file)
-                    doi: str = data.get("DOI", {}).get("DOI", "")
-                    dataset_globalId: Optional[str] = self.generate_uuid_from_shortname(doi) if doi else None
-                    if dataset_globalId and "Projects" in data:
-                        for project in data["Projects"]:
-                            project_short_name: Optional[str] = project.get("ShortName")
-                            if project_short_name:
-                                project_globalId: Optional[str] = self.generate_uuid_from_shortname(project_short_name)
-                                if project_globalId:
-                                    relationships.append((dataset_globalId, project_globalId))
-                                else:
-                                    self.logger.warning(f"Failed to generate UUID for project: {project_short_name}")
-                    else:
-                        self.logger.warning(f"No DOI or Projects found in file: {json_file}")
+                data = self._load_json(json_file)
+                doi: str = data.get("DOI", {}).get("DOI", "")
+                dataset_globalId: Optional[str] = self.generate_uuid_from_shortname(doi) if doi else None
+                if dataset_globalId and "Projects" in data:
+                    for project in data["Projects"]:
+                        project_short_name: Optional[str] = project.get("ShortName")
+                        if project_short_name:
+                            project_globalId: Optional[str] = self.generate_uuid_from_shortname(project_short_name)
+                            if project_globalId:
+                                relationships.append((dataset_globalId, project_globalId))
+                            else:
+                                self.logger.warning(f"Failed to generate UUID for project: {project_short_name}")
+                else:
+                    self.logger.warning(f"No DOI or Projects found in file: {json_file}")
             except Exception as e:
                 self.logger.error(f"Failed to process file: {json_file}. Error: {e}")
 
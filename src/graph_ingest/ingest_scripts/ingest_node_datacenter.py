@@ -1,7 +1,7 @@
 import os
 import json
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List
 from tqdm import tqdm
 
 from graph_ingest.common.dbconfig import get_driver
@@ -54,28 +54,39 @@ class DataCenterIngestor:
                 url=data_center["url"],
             )
 
+    def extract_data_centers(self, data: Dict[str, Any]) -> List[Dict[str, str]]:
+        return [
+            {
+                "shortName": center.get("ShortName", "N/A"),
+                "longName": center.get("LongName", "N/A"),
+                "url": center.get("ContactInformation", {}).get("RelatedUrls", [{}])[0].get("URL", "N/A"),
+            }
+            for center in data.get("DataCenters", [])
+        ]
+
+    def write_data_centers(self, session: Any, data_centers: Iterable[Dict[str, str]], batch_size: int = 100) -> None:
+        data_centers_batch: List[Dict[str, str]] = []
+        for data_center in data_centers:
+            data_centers_batch.append(data_center)
+            if len(data_centers_batch) >= batch_size:
+                session.execute_write(self.add_data_centers_batch, data_centers_batch)
+                data_centers_batch = []
+        if data_centers_batch:
+            session.execute_write(self.add_data_centers_batch, data_centers_batch)
+
+    def _iter_data_centers(self, json_files: Iterable[str]) -> Iterator[Dict[str, str]]:
+        for json_file in json_files:
+            with open(json_file, "r") as file:
+                data = json.load(file)
+            yield from self.extract_data_centers(data)
+
     def process_files(self, batch_size: int = 100) -> None:
         start_dir: str = self.config.paths.dataset_metadata_directory  # Updated access
         json_files = list(find_json_files(start_dir))
-        data_centers_batch: List[Dict[str, Any]] = []
 
         with self.driver.session() as session:
-            for json_file in tqdm(json_files, desc="Processing files", unit="file"):
-                with open(json_file, "r") as file:
-                    data = json.load(file)
-                    if "DataCenters" in data:
-                        for center in data["DataCenters"]:
-                            data_center: Dict[str, str] = {
-                                "shortName": center.get("ShortName", "N/A"),
-                                "longName": center.get("LongName", "N/A"),
-                                "url": center.get("ContactInformation", {}).get("RelatedUrls", [{}])[0].get("URL", "N/A"),
-                            }
-                            data_centers_batch.append(data_center)
-                            if len(data_centers_batch) >= batch_size:
-                                session.execute_write(self.add_data_centers_batch, data_centers_batch)
-                                data_centers_batch = []
-            if data_centers_batch:
-                session.execute_write(self.add_data_centers_batch, data_centers_batch)
+            data_centers = self._iter_data_centers(tqdm(json_files, desc="Processing files", unit="file"))
+            self.write_data_centers(session, data_centers, batch_size)
 
 
 def main() -> None:
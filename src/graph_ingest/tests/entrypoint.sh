@@ -11,4 +11,4 @@ echo "Waiting for Neo4j to be ready..."
 
 # Run tests
 echo "Running tests..."
-python -m pytest graph_ingest/tests/unit/ -v --cov=graph_ingest.ingest_scripts --cov-report=term-missing --cov-report=xml:/app/test-results/coverage.xml 
\ No newline at end of file
+python -m pytest graph_ingest/tests/unit/ -n auto --dist loadgroup -v --cov=graph_ingest.ingest_scripts --cov-report=term-missing --cov-report=xml:/app/test-results/coverage.xml 
\ No newline at end of file
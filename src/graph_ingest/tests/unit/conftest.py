@@ -0,0 +1,20 @@
+"""Unit test fixtures and configuration."""
+
+import os
+
+import pytest
+
+# tqdm reads TQDM_* overrides when it is imported, so this has to be set before
+# the test modules import the ingest scripts; a fixture would run too late.
+os.environ.setdefault("TQDM_DISABLE", "1")
+
+from graph_ingest.tests.unit.base_test import BaseIngestorTest
+
+@pytest.fixture(scope="session")
+def mock_config():
+    """Standard mock AppConfig, built once per session.
+
+    Shared by every test that requests it, so tests must not mutate it; use
+    dataclasses.replace to derive a variant instead.
+    """
+    return BaseIngestorTest().setup_mock_config()
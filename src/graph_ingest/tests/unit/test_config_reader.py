@@ -60,5 +60,35 @@ def test_config_structure():
             if value is not None:
                 os.environ[var] = value
 
+def test_projection_config():
+    """Test that the projection section is optional and read when present."""
+    base_config = {
+        "database": {"uri": "neo4j://localhost:7687", "user": "neo4j", "password": "password"},
+        "paths": {
+            "source_dois_directory": "/path/to/dois",
+            "dataset_metadata_directory": "/path/to/datasets",
+            "gcmd_sciencekeyword_directory": "/path/to/keywords",
+            "publications_metadata_directory": "/path/to/publications",
+            "pubs_of_pubs": "/path/to/pubs_of_pubs",
+            "log_directory": "/path/to/logs"
+        }
+    }
+    with_projection = dict(
+        base_config, projection={"node_labels": ["Dataset"], "rel_types": ["CITES"], "export_csv": True}
+    )
+
+    with patch("builtins.open", mock_open(read_data=json.dumps(base_config))):
+        default = load_config()
+    with patch("builtins.open", mock_open(read_data=json.dumps(with_projection))):
+        configured = load_config()
+
+    # Without the section everything is projected
+    assert default.projection.node_labels == "*"
+    assert default.projection.rel_types == "*"
+    assert default.projection.export_csv is False
+    assert configured.projection.node_labels == ["Dataset"]
+    assert configured.projection.rel_types == ["CITES"]
+    assert configured.projection.export_csv is True
+
 if __name__ == "__main__":
     pytest.main() 
\ No newline at end of file
@@ -1,12 +1,15 @@
 """Unit tests for datacenter ingestion."""
 
 import pytest
+import io
 import os
 import json
 import logging
-from unittest.mock import patch, MagicMock, mock_open, ANY, PropertyMock, call
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock, DEFAULT, ANY, PropertyMock, call
 
 from graph_ingest.common.config_reader import AppConfig, DatabaseConfig, PathsConfig
+from graph_ingest.ingest_scripts import ingest_node_datacenter as _mod
 from graph_ingest.ingest_scripts.ingest_node_datacenter import DataCenterIngestor, main
 
 # Sample test data
@@ -95,92 +98,56 @@ MOCK_NO_DATACENTERS = {
     "SomeOtherKey": []
 }
 
+# Serialized payloads, built once at import time
+_MOCK_DATACENTER_JSON = json.dumps(MOCK_DATACENTER)
+_MOCK_DATACENTER_MULTIPLE_JSON = json.dumps(MOCK_DATACENTER_MULTIPLE)
+_MOCK_DATACENTER_MISSING_FIELDS_JSON = json.dumps(MOCK_DATACENTER_MISSING_FIELDS)
+_MOCK_DATACENTER_MISSING_URL_JSON = json.dumps(MOCK_DATACENTER_MISSING_URL)
+_MOCK_NO_DATACENTERS_JSON = json.dumps(MOCK_NO_DATACENTERS)
+
+
+def _fake_open(payload):
+    """Return an ``open`` replacement that serves ``payload`` from memory."""
+    return lambda *args, **kwargs: io.StringIO(payload)
+
 
 class TestDataCenterIngestor:
     """Tests for the DataCenterIngestor class."""
 
-    def setup_method(self):
-        """Set up test fixtures before each test method."""
-        self.mock_config = AppConfig(
-            database=DatabaseConfig(
-                uri="bolt://neo4j:7687",
-                user="neo4j",
-                password="password"
-            ),
-            paths=PathsConfig(
-                source_dois_directory="/path/to/dois",
-                dataset_metadata_directory="/mock/data/dir",
-                gcmd_sciencekeyword_directory="/path/to/keywords",
-                publications_metadata_directory="/path/to/publications",
-                pubs_of_pubs="/path/to/pubs_of_pubs",
-                log_directory="/mock/log/dir"
-            )
-        )
-
-    def test_initialization(self, mock_env_get):
+    def test_initialization(self, mock_config, ingest_patches):
         """Test initialization of DataCenterIngestor."""
         # Act
-        with patch('graph_ingest.ingest_scripts.ingest_node_datacenter.load_config', return_value=self.mock_config), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.os.makedirs') as mock_makedirs, \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.setup_logger') as mock_setup_logger, \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.get_driver') as mock_get_driver:
-            
-            ingestor = DataCenterIngestor()
-            
-            # Assert
-            assert ingestor.config == self.mock_config
-            assert ingestor.log_directory == "/mock/log/dir"
-            mock_makedirs.assert_called_once_with("/mock/log/dir", exist_ok=True)
-            mock_setup_logger.assert_called_once()
-            mock_get_driver.assert_called_once()
-
-    def test_set_uniqueness_constraint_success(self, mock_env_get):
-        """Test setting uniqueness constraint successfully."""
+        ingestor = DataCenterIngestor()
+
+        # Assert
+        assert ingestor.config == mock_config
+        assert ingestor.log_directory == "/mock/log/dir"
+        ingest_patches.makedirs.assert_called_once_with("/mock/log/dir", exist_ok=True)
+        ingest_patches.setup_logger.assert_called_once()
+        ingest_patches.get_driver.assert_called_once()
+
+    @pytest.mark.parametrize("side_effect,log_method,message", [
+        (None, "info", "Uniqueness constraint on DataCenter.globalId set successfully."),
+        (Exception("Constraint already exists"), "error",
+         "Failed to create uniqueness constraint: Constraint already exists"),
+    ], ids=["success", "failure"])
+    def test_set_uniqueness_constraint(self, ingestor, driver_session,
+                                       side_effect, log_method, message):
+        """Test setting the uniqueness constraint and logging the outcome."""
         # Arrange
-        mock_session = MagicMock()
-        mock_driver = MagicMock()
-        mock_driver.session.return_value.__enter__.return_value = mock_session
+        _, mock_session = driver_session
+        mock_session.run.side_effect = side_effect
 
         # Act
-        with patch('graph_ingest.ingest_scripts.ingest_node_datacenter.load_config', return_value=self.mock_config), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.os.makedirs'), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.setup_logger'), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.get_driver', return_value=mock_driver):
-            
-            ingestor = DataCenterIngestor()
-            ingestor.set_uniqueness_constraint()
-            
-            # Assert
-            mock_session.run.assert_called_once_with(
-                "CREATE CONSTRAINT FOR (dc:DataCenter) REQUIRE dc.globalId IS UNIQUE"
-            )
-
-    def test_set_uniqueness_constraint_failure(self, mock_env_get):
-        """Test handling error when setting uniqueness constraint."""
-        # Arrange
-        mock_session = MagicMock()
-        mock_session.run.side_effect = Exception("Constraint already exists")
-        mock_driver = MagicMock()
-        mock_driver.session.return_value.__enter__.return_value = mock_session
-        mock_logger = MagicMock()
+        ingestor.set_uniqueness_constraint()
 
-        # Act
-        with patch('graph_ingest.ingest_scripts.ingest_node_datacenter.load_config', return_value=self.mock_config), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.os.makedirs'), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.setup_logger', return_value=mock_logger), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.get_driver', return_value=mock_driver):
-            
-            ingestor = DataCenterIngestor()
-            ingestor.logger = mock_logger
-            ingestor.set_uniqueness_constraint()
-            
-            # Assert
-            mock_session.run.assert_called_once()
-            mock_logger.error.assert_called_once_with(
-                "Failed to create uniqueness constraint: Constraint already exists"
-            )
+        # Assert
+        mock_session.run.assert_called_once_with(
+            "CREATE CONSTRAINT FOR (dc:DataCenter) REQUIRE dc.globalId IS UNIQUE"
+        )
+        getattr(ingestor.logger, log_method).assert_called_once_with(message)
 
-    def test_add_data_centers_batch(self, mock_env_get):
+    def test_add_data_centers_batch(self, ingestor):
         """Test adding a batch of data centers."""
         # Arrange
         mock_tx = MagicMock()
@@ -193,172 +160,59 @@ class TestDataCenterIngestor:
         ]
 
         # Act
-        with patch('graph_ingest.ingest_scripts.ingest_node_datacenter.load_config', return_value=self.mock_config), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.os.makedirs'), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.setup_logger'), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.get_driver'), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.generate_uuid_from_name', return_value="test-uuid"):
-            
-            ingestor = DataCenterIngestor()
+        with patch.object(_mod, 'generate_uuid_from_name', return_value="test-uuid"):
             ingestor.add_data_centers_batch(mock_tx, data_centers_batch)
-            
-            # Assert
-            mock_tx.run.assert_called_once_with(
-                "MERGE (dc:DataCenter {globalId: $globalId}) "
-                "ON CREATE SET dc.shortName = $shortName, dc.longName = $longName, dc.url = $url",
-                globalId="test-uuid",
-                shortName="PODAAC",
-                longName="Physical Oceanography Distributed Active Archive Center",
-                url="https://podaac.jpl.nasa.gov"
-            )
-
-    def test_process_files_single_datacenter(self, mock_env_get):
-        """Test processing a single datacenter."""
-        # Arrange
-        mock_session = MagicMock()
-        mock_driver = MagicMock()
-        mock_driver.session.return_value.__enter__.return_value = mock_session
-
-        # Act
-        with patch('graph_ingest.ingest_scripts.ingest_node_datacenter.load_config', return_value=self.mock_config), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.os.makedirs'), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.setup_logger'), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.get_driver', return_value=mock_driver), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.find_json_files', return_value=["test.json"]), \
-             patch('builtins.open', mock_open(read_data=json.dumps(MOCK_DATACENTER))):
-            
-            ingestor = DataCenterIngestor()
-            ingestor.process_files()
-            
-            # Assert
-            mock_session.execute_write.assert_called_once()
-
-    def test_process_files_multiple_datacenters(self, mock_env_get):
-        """Test processing multiple datacenters."""
-        # Arrange
-        mock_session = MagicMock()
-        mock_driver = MagicMock()
-        mock_driver.session.return_value.__enter__.return_value = mock_session
 
-        # Act
-        with patch('graph_ingest.ingest_scripts.ingest_node_datacenter.load_config', return_value=self.mock_config), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.os.makedirs'), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.setup_logger'), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.get_driver', return_value=mock_driver), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.find_json_files', return_value=["test.json"]), \
-             patch('builtins.open', mock_open(read_data=json.dumps(MOCK_DATACENTER_MULTIPLE))):
-            
-            ingestor = DataCenterIngestor()
-            ingestor.process_files()
-            
-            # Assert
-            mock_session.execute_write.assert_called_once()
+        # Assert
+        mock_tx.run.assert_called_once_with(
+            "MERGE (dc:DataCenter {globalId: $globalId}) "
+            "ON CREATE SET dc.shortName = $shortName, dc.longName = $longName, dc.url = $url",
+            globalId="test-uuid",
+            shortName="PODAAC",
+            longName="Physical Oceanography Distributed Active Archive Center",
+            url="https://podaac.jpl.nasa.gov"
+        )
 
-    def test_process_files_no_datacenters(self, mock_env_get):
-        """Test processing a file with no datacenters."""
+    @pytest.mark.parametrize("payload,expected_calls", [
+        (_MOCK_DATACENTER_JSON, 1),
+        (_MOCK_DATACENTER_MULTIPLE_JSON, 1),
+        (_MOCK_NO_DATACENTERS_JSON, 0),
+        (_MOCK_DATACENTER_MISSING_FIELDS_JSON, 1),
+        (_MOCK_DATACENTER_MISSING_URL_JSON, 1),
+    ], ids=["single", "multiple", "none", "missing_fields", "missing_url"])
+    def test_process_files(self, ingestor, driver_session, payload, expected_calls):
+        """Test processing a file of datacenters, including malformed entries."""
         # Arrange
-        mock_session = MagicMock()
-        mock_driver = MagicMock()
-        mock_driver.session.return_value.__enter__.return_value = mock_session
+        _, mock_session = driver_session
 
         # Act
-        with patch('graph_ingest.ingest_scripts.ingest_node_datacenter.load_config', return_value=self.mock_config), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.os.makedirs'), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.setup_logger'), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.get_driver', return_value=mock_driver), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.find_json_files', return_value=["test.json"]), \
-             patch('builtins.open', mock_open(read_data=json.dumps(MOCK_NO_DATACENTERS))):
-            
-            ingestor = DataCenterIngestor()
+        with patch.object(_mod, 'find_json_files', return_value=["test.json"]), \
+             patch('builtins.open', side_effect=_fake_open(payload)):
             ingestor.process_files()
-            
-            # Assert
-            mock_session.execute_write.assert_not_called()
 
-    def test_process_files_missing_fields(self, mock_env_get):
-        """Test processing a file with missing fields."""
-        # Arrange
-        mock_session = MagicMock()
-        mock_driver = MagicMock()
-        mock_driver.session.return_value.__enter__.return_value = mock_session
+        # Assert
+        assert mock_session.execute_write.call_count == expected_calls
 
-        # Act
-        with patch('graph_ingest.ingest_scripts.ingest_node_datacenter.load_config', return_value=self.mock_config), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.os.makedirs'), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.setup_logger'), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.get_driver', return_value=mock_driver), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.find_json_files', return_value=["test.json"]), \
-             patch('builtins.open', mock_open(read_data=json.dumps(MOCK_DATACENTER_MISSING_FIELDS))):
-            
-            ingestor = DataCenterIngestor()
-            ingestor.process_files()
-            
-            # Assert
-            mock_session.execute_write.assert_called_once()
-
-    def test_process_files_missing_url(self, mock_env_get):
-        """Test processing a file with missing URL."""
+    def test_write_data_centers_batches(self, ingestor, driver_session):
+        """Test that data centers are written in batch_size chunks."""
         # Arrange
-        mock_session = MagicMock()
-        mock_driver = MagicMock()
-        mock_driver.session.return_value.__enter__.return_value = mock_session
+        _, mock_session = driver_session
+        data_centers = [{"shortName": "DAAC", "longName": "Test DAAC", "url": "https://daac.test.gov"}] * 150
 
         # Act
-        with patch('graph_ingest.ingest_scripts.ingest_node_datacenter.load_config', return_value=self.mock_config), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.os.makedirs'), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.setup_logger'), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.get_driver', return_value=mock_driver), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.find_json_files', return_value=["test.json"]), \
-             patch('builtins.open', mock_open(read_data=json.dumps(MOCK_DATACENTER_MISSING_URL))):
-            
-            ingestor = DataCenterIngestor()
-            ingestor.process_files()
-            
-            # Assert
-            mock_session.execute_write.assert_called_once()
+        ingestor.write_data_centers(mock_session, data_centers, batch_size=50)
 
-    def test_process_files_batch_processing(self, mock_env_get):
-        """Test batch processing of files."""
-        # Arrange
-        mock_session = MagicMock()
-        mock_driver = MagicMock()
-        mock_driver.session.return_value.__enter__.return_value = mock_session
-
-        # Create a list of 150 datacenters (more than default batch size)
-        large_datacenter_list = {
-            "DataCenters": [
-                {
-                    "ShortName": f"DAAC{i}",
-                    "LongName": f"Test DAAC {i}",
-                    "ContactInformation": {
-                        "RelatedUrls": [{"URL": f"https://daac{i}.test.gov"}]
-                    }
-                } for i in range(150)
-            ]
-        }
-
-        # Act
-        with patch('graph_ingest.ingest_scripts.ingest_node_datacenter.load_config', return_value=self.mock_config), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.os.makedirs'), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.setup_logger'), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.get_driver', return_value=mock_driver), \
-             patch('graph_ingest.ingest_scripts.ingest_node_datacenter.find_json_files', return_value=["test.json"]), \
-             patch('builtins.open', mock_open(read_data=json.dumps(large_datacenter_list))):
-            
-            ingestor = DataCenterIngestor()
-            ingestor.process_files(batch_size=50)
-            
-            # Assert
-            # With 150 datacenters and batch size 50, we expect 3 batch executions
-            assert mock_session.execute_write.call_count == 3
+        # Assert
+        # With 150 datacenters and batch size 50, we expect 3 batch executions
+        assert mock_session.execute_write.call_count == 3
 
-    def test_main_function(self, mock_env_get):
+    def test_main_function(self):
         """Test the main function."""
         # Arrange
         mock_ingestor = MagicMock()
 
         # Act
-        with patch('graph_ingest.ingest_scripts.ingest_node_datacenter.DataCenterIngestor', return_value=mock_ingestor):
+        with patch.object(_mod, 'DataCenterIngestor', return_value=mock_ingestor):
             main()
             
             # Assert
@@ -367,7 +221,53 @@ class TestDataCenterIngestor:
 
 
 @pytest.fixture
-def mock_env_get():
-    """Mock environment variable getter."""
-    with patch('os.environ.get') as mock:
-        yield mock 
\ No newline at end of file
+def mock_config():
+    """Standard configuration returned by the patched load_config."""
+    return AppConfig(
+        database=DatabaseConfig(
+            uri="bolt://neo4j:7687",
+            user="neo4j",
+            password="password"
+        ),
+        paths=PathsConfig(
+            source_dois_directory="/path/to/dois",
+            dataset_metadata_directory="/mock/data/dir",
+            gcmd_sciencekeyword_directory="/path/to/keywords",
+            publications_metadata_directory="/path/to/publications",
+            pubs_of_pubs="/path/to/pubs_of_pubs",
+            log_directory="/mock/log/dir"
+        )
+    )
+
+
+@pytest.fixture(autouse=True)
+def ingest_patches(mock_config):
+    """Patch the DataCenterIngestor constructor dependencies.
+
+    Tests configure return values on the yielded mocks as needed.
+    """
+    with patch.multiple(_mod, load_config=MagicMock(return_value=mock_config),
+                        setup_logger=DEFAULT, get_driver=DEFAULT) as mocks, \
+         patch.object(_mod.os, 'makedirs') as mock_makedirs:
+        yield SimpleNamespace(
+            makedirs=mock_makedirs,
+            setup_logger=mocks["setup_logger"],
+            get_driver=mocks["get_driver"],
+        )
+
+
+@pytest.fixture
+def ingestor(ingest_patches, driver_session):
+    """DataCenterIngestor built against the patched dependencies and driver_session."""
+    ingest_patches.get_driver.return_value = driver_session[0]
+    return DataCenterIngestor()
+
+
+@pytest.fixture
+def driver_session():
+    """Neo4j driver mock whose session() context yields a constrained session mock."""
+    mock_session = MagicMock(spec=['run', 'execute_write'])
+    mock_driver = MagicMock()
+    mock_driver.session.return_value.__enter__.return_value = mock_session
+    mock_driver.session.return_value.__exit__.return_value = False
+    return mock_driver, mock_session
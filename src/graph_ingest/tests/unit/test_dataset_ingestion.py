@@ -1,193 +1,190 @@
 """Unit tests for dataset ingestion."""
 
+import copy
 import pytest
-from unittest.mock import patch, MagicMock, mock_open, ANY, PropertyMock, call
+from contextlib import ExitStack
+from unittest.mock import patch, Mock, MagicMock, create_autospec, mock_open, ANY, call
 import os
-import json
-import logging
-import io  # For creating a mock file object
 
+import graph_ingest.ingest_scripts.ingest_node_dataset as ing_mod
 from graph_ingest.ingest_scripts.ingest_node_dataset import DatasetIngestor, main
-from graph_ingest.tests.fixtures.test_data import MOCK_DATASET
 from graph_ingest.tests.unit.base_test import BaseIngestorTest
-from graph_ingest.tests.utils.mock_helpers import setup_test_file_system, patch_json_load_with_data
+from graph_ingest.tests.utils.mock_helpers import make_driver_mock
+
+# Autospecced once per module. Copies would share child mocks with it, so tests
+# reset it before use instead.
+_DATASET_INGESTOR_SPEC = create_autospec(DatasetIngestor, instance=True)
+
+# Dataset node properties passed to add_datasets
+_TEST_DATASETS = [
+    {
+        "globalId": "dataset-1",
+        "doi": "10.1234/test1",
+        "shortName": "TEST1",
+        "longName": "Test Dataset 1",
+        "daac": "TEST-DAAC",
+        "abstract": "Test abstract 1",
+        "cmrId": "C1234",
+        "temporalExtentStart": "2020-01-01",
+        "temporalExtentEnd": "2020-12-31",
+        "temporalFrequency": "Daily"
+    },
+    {
+        "globalId": "dataset-2",
+        "doi": "10.1234/test2",
+        "shortName": "TEST2",
+        "longName": "Test Dataset 2",
+        "daac": "TEST-DAAC",
+        "abstract": "Test abstract 2",
+        "cmrId": "C5678",
+        "temporalExtentStart": "2021-01-01",
+        "temporalExtentEnd": "2021-12-31",
+        "temporalFrequency": "Monthly"
+    }
+]
+
+# Parsed dataset metadata files, in the order process_files reads them
+_TEST_JSON_DOCS = (
+    {  # First file - valid
+        "DOI": {"DOI": "10.1234/test1"},
+        "CMR_ID": "C1234",
+        "ShortName": "TEST1",
+        "EntryTitle": "Test Dataset 1",
+        "Abstract": "Test abstract 1"
+    },
+    {  # Second file - valid
+        "DOI": {"DOI": "10.1234/test2"},
+        "CMR_ID": "C5678",
+        "ShortName": "TEST2",
+        "EntryTitle": "Test Dataset 2",
+        "Abstract": "Test abstract 2"
+    },
+    {  # Third file - invalid (missing DOI and CMR_ID)
+        "ShortName": "INVALID",
+        "EntryTitle": "Invalid Dataset"
+    },
+)
+
+def _run_process_files(ingestor, monkeypatch, docs, **kwargs):
+    """Run process_files over one mock file per parsed document in docs."""
+    paths = [f"/mock/path/dataset{i}.json" for i in range(len(docs))]
+    monkeypatch.setattr(ing_mod, 'find_json_files', Mock(return_value=paths))
+    monkeypatch.setattr(ing_mod, 'tqdm', lambda files, **_: files)
+    monkeypatch.setattr(ing_mod, 'open', mock_open(), raising=False)
+    monkeypatch.setattr(ing_mod.json, 'load', Mock(side_effect=iter(docs)))
+    return ingestor.process_files(**kwargs)
+
+@pytest.fixture(scope="module")
+def driver_session():
+    """Neo4j driver and session mocks shared by every test in this module."""
+    return make_driver_mock()
+
+@pytest.fixture(autouse=True)
+def _reset_driver(driver_session):
+    """Clear calls recorded on the shared driver and session after each test."""
+    yield
+    for mock in driver_session:
+        mock.reset_mock()
 
 class TestDatasetIngestor(BaseIngestorTest):
     """Tests for the DatasetIngestor class."""
 
-    @patch('graph_ingest.ingest_scripts.ingest_node_dataset.setup_logger')
-    @patch('graph_ingest.ingest_scripts.ingest_node_dataset.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_node_dataset.get_driver')
-    @patch('os.makedirs')
-    def test_initialization(self, mock_makedirs, mock_get_driver, mock_load_config, mock_setup_logger):
+    @pytest.fixture(autouse=True)
+    def _patch_env(self, monkeypatch):
+        """Replace the constructor dependencies with mocks on self; makedirs is a no-op."""
+        self.mock_setup_logger = Mock()
+        self.mock_load_config = Mock(return_value=self.setup_mock_config())
+        self.mock_get_driver = Mock()
+        monkeypatch.setattr(ing_mod, 'setup_logger', self.mock_setup_logger)
+        monkeypatch.setattr(ing_mod, 'load_config', self.mock_load_config)
+        monkeypatch.setattr(ing_mod, 'get_driver', self.mock_get_driver)
+        monkeypatch.setattr(os, 'makedirs', lambda *args, **kwargs: None)
+
+    @pytest.fixture(scope="class")
+    def _ingestor_proto(self):
+        """DatasetIngestor constructed once with its dependencies patched.
+
+        The prototype holds Mock config, logger and driver attributes, and
+        mocks cannot be pickled, so it is rebuilt per run rather than stored
+        in the pytest cache.
+        """
+        with ExitStack() as stack:
+            stack.enter_context(patch.object(ing_mod, 'setup_logger'))
+            stack.enter_context(patch.object(ing_mod, 'load_config', return_value=self.setup_mock_config()))
+            stack.enter_context(patch.object(ing_mod, 'get_driver'))
+            stack.enter_context(patch.object(os, 'makedirs'))
+            return DatasetIngestor()
+
+    @pytest.fixture
+    def ingestor(self, _ingestor_proto):
+        """Shallow copy of the prototype with a fresh driver and logger."""
+        ingestor = copy.copy(_ingestor_proto)
+        ingestor.driver = MagicMock()
+        ingestor.logger = Mock()
+        return ingestor
+
+    def test_initialization(self, monkeypatch):
         """Test initialization of DatasetIngestor."""
         # Arrange
-        mock_config = self.setup_mock_config()
-        mock_load_config.return_value = mock_config
+        mock_makedirs = Mock()
+        monkeypatch.setattr(os, 'makedirs', mock_makedirs)
         
-        mock_logger = MagicMock(spec=logging.Logger)
-        mock_setup_logger.return_value = mock_logger
+        mock_config = self.mock_load_config.return_value
         
-        mock_driver = MagicMock()
-        mock_get_driver.return_value = mock_driver
+        mock_logger = Mock()
+        self.mock_setup_logger.return_value = mock_logger
+        
+        mock_driver = Mock()
+        self.mock_get_driver.return_value = mock_driver
         
         # Act
         ingestor = DatasetIngestor()
         
         # Assert
         mock_makedirs.assert_called_once_with('/mock/log/dir', exist_ok=True)
-        mock_setup_logger.assert_called_once()
-        mock_get_driver.assert_called_once()
+        self.mock_setup_logger.assert_called_once()
+        self.mock_get_driver.assert_called_once()
         assert ingestor.driver == mock_driver
         assert ingestor.logger == mock_logger
         assert ingestor.config == mock_config
 
-    @patch('graph_ingest.ingest_scripts.ingest_node_dataset.setup_logger')
-    @patch('graph_ingest.ingest_scripts.ingest_node_dataset.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_node_dataset.get_driver')
-    @patch('os.makedirs')
-    def test_set_uniqueness_constraint(self, mock_makedirs, mock_get_driver, mock_load_config, mock_setup_logger):
+    def test_set_uniqueness_constraint(self, ingestor, driver_session):
         """Test setting uniqueness constraint."""
         # Arrange
-        mock_config = self.setup_mock_config()
-        mock_load_config.return_value = mock_config
-        
-        mock_logger = MagicMock()
-        mock_setup_logger.return_value = mock_logger
-        
-        # Setup Neo4j session
-        mock_session = MagicMock()
-        mock_driver = MagicMock()
-        mock_driver.session.return_value.__enter__.return_value = mock_session
-        mock_get_driver.return_value = mock_driver
+        ingestor.driver, mock_session = driver_session
         
         # Act
-        ingestor = DatasetIngestor()
         ingestor.set_uniqueness_constraint()
         
         # Assert
         mock_session.run.assert_called_with("CREATE CONSTRAINT dataset_globalid IF NOT EXISTS FOR (d:Dataset) REQUIRE d.globalId IS UNIQUE")
 
-    @patch('graph_ingest.ingest_scripts.ingest_node_dataset.setup_logger')
-    @patch('graph_ingest.ingest_scripts.ingest_node_dataset.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_node_dataset.get_driver')
-    @patch('os.makedirs')
-    def test_extract_daac(self, mock_makedirs, mock_get_driver, mock_load_config, mock_setup_logger):
+    @pytest.mark.parametrize("data,expected", [
+        ({"DataCenters": [{"ShortName": "TEST-DAAC", "Roles": ["ARCHIVER"]}]}, "TEST-DAAC"),
+        ({"DataCenters": [{"ShortName": "TEST-DAAC", "Roles": ["DISTRIBUTOR"]}]}, "N/A"),
+        ({}, "N/A"),
+        ({"DataCenters": [{"Roles": ["ARCHIVER"]}]}, "N/A"),
+    ], ids=["archiver", "no_archiver", "no_datacenters", "no_shortname"])
+    def test_extract_daac(self, ingestor, data, expected):
         """Test DAAC extraction from dataset metadata."""
-        # Setup
-        mock_config = self.setup_mock_config()
-        mock_load_config.return_value = mock_config
-        mock_setup_logger.return_value = MagicMock()
-        
-        ingestor = DatasetIngestor()
-        
-        # Test case 1: DAAC with ARCHIVER role
-        data_with_daac = {
-            "DataCenters": [
-                {
-                    "ShortName": "TEST-DAAC",
-                    "Roles": ["ARCHIVER"]
-                }
-            ]
-        }
-        daac = ingestor.extract_daac(data_with_daac)
-        assert daac == "TEST-DAAC"
-        
-        # Test case 2: DAAC without ARCHIVER role
-        data_without_archiver = {
-            "DataCenters": [
-                {
-                    "ShortName": "TEST-DAAC",
-                    "Roles": ["DISTRIBUTOR"]
-                }
-            ]
-        }
-        daac = ingestor.extract_daac(data_without_archiver)
-        assert daac == "N/A"
-        
-        # Test case 3: No DataCenters
-        data_without_datacenters = {}
-        daac = ingestor.extract_daac(data_without_datacenters)
-        assert daac == "N/A"
-        
-        # Test case 4: DataCenters without ShortName
-        data_without_shortname = {
-            "DataCenters": [
-                {
-                    "Roles": ["ARCHIVER"]
-                }
-            ]
-        }
-        daac = ingestor.extract_daac(data_without_shortname)
-        assert daac == "N/A"
+        assert ingestor.extract_daac(data) == expected
 
-    @patch('graph_ingest.ingest_scripts.ingest_node_dataset.setup_logger')
-    @patch('graph_ingest.ingest_scripts.ingest_node_dataset.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_node_dataset.get_driver')
-    @patch('os.makedirs')
-    def test_extract_temporal_extent(self, mock_makedirs, mock_get_driver, mock_load_config, mock_setup_logger):
+    @pytest.mark.parametrize("data,expected", [
+        ({"TemporalExtents": [{"RangeDateTimes": [{
+            "BeginningDateTime": "2020-01-01T00:00:00Z",
+            "EndingDateTime": "2020-12-31T23:59:59Z"
+        }]}]}, ("2020-01-01T00:00:00Z", "2020-12-31T23:59:59Z")),
+        ({}, (None, None)),
+        ({"TemporalExtents": []}, (None, None)),
+        ({"TemporalExtents": [{"OtherField": "value"}]}, (None, None)),
+        ({"TemporalExtents": [{"RangeDateTimes": []}]}, (None, None)),
+    ], ids=["complete", "no_extents", "empty_extents", "no_range", "empty_range"])
+    def test_extract_temporal_extent(self, ingestor, data, expected):
         """Test temporal extent extraction from dataset metadata."""
-        # Setup
-        mock_config = self.setup_mock_config()
-        mock_load_config.return_value = mock_config
-        mock_setup_logger.return_value = MagicMock()
-        
-        ingestor = DatasetIngestor()
-        
-        # Test case 1: Complete temporal extents
-        data_with_temporal = {
-            "TemporalExtents": [
-                {
-                    "RangeDateTimes": [
-                        {
-                            "BeginningDateTime": "2020-01-01T00:00:00Z",
-                            "EndingDateTime": "2020-12-31T23:59:59Z"
-                        }
-                    ]
-                }
-            ]
-        }
-        start, end = ingestor.extract_temporal_extent(data_with_temporal)
-        assert start == "2020-01-01T00:00:00Z"
-        assert end == "2020-12-31T23:59:59Z"
-        
-        # Test case 2: No temporal extents
-        data_without_temporal = {}
-        start, end = ingestor.extract_temporal_extent(data_without_temporal)
-        assert start is None
-        assert end is None
-        
-        # Test case 3: Empty temporal extents
-        data_with_empty_temporal = {"TemporalExtents": []}
-        start, end = ingestor.extract_temporal_extent(data_with_empty_temporal)
-        assert start is None
-        assert end is None
-        
-        # Test case 4: No RangeDateTimes
-        data_with_no_range = {"TemporalExtents": [{"OtherField": "value"}]}
-        start, end = ingestor.extract_temporal_extent(data_with_no_range)
-        assert start is None
-        assert end is None
-        
-        # Test case 5: Empty RangeDateTimes
-        data_with_empty_range = {"TemporalExtents": [{"RangeDateTimes": []}]}
-        start, end = ingestor.extract_temporal_extent(data_with_empty_range)
-        assert start is None
-        assert end is None
+        assert ingestor.extract_temporal_extent(data) == expected
 
-    @patch('graph_ingest.ingest_scripts.ingest_node_dataset.setup_logger')
-    @patch('graph_ingest.ingest_scripts.ingest_node_dataset.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_node_dataset.get_driver')
-    @patch('os.makedirs')
-    def test_extract_frequency(self, mock_makedirs, mock_get_driver, mock_load_config, mock_setup_logger):
+    def test_extract_frequency(self, ingestor):
         """Test frequency extraction from dataset metadata."""
-        # Setup
-        mock_config = self.setup_mock_config()
-        mock_load_config.return_value = mock_config
-        mock_setup_logger.return_value = MagicMock()
-        
-        ingestor = DatasetIngestor()
-        
         # Test case 1: With frequency
         data_with_frequency = {"Frequency": "Daily"}
         frequency = ingestor.extract_frequency(data_with_frequency)
@@ -198,100 +195,45 @@ class TestDatasetIngestor(BaseIngestorTest):
         frequency = ingestor.extract_frequency(data_without_frequency)
         assert frequency == "Unknown"
 
-    @patch('graph_ingest.ingest_scripts.ingest_node_dataset.setup_logger')
-    @patch('graph_ingest.ingest_scripts.ingest_node_dataset.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_node_dataset.get_driver')
-    @patch('os.makedirs')
-    def test_process_files_simplified(self, mock_makedirs, mock_get_driver, mock_load_config, mock_setup_logger):
-        """Simplified test for process_files method"""
-        # Setup
-        mock_config = self.setup_mock_config()
-        mock_load_config.return_value = mock_config
-        mock_logger = MagicMock()
-        mock_setup_logger.return_value = mock_logger
-        
-        # Mock the ingestor
-        ingestor = DatasetIngestor()
-        
-        # Setup file paths - important to make these fixed not iterable
-        file_paths = [
-            "/mock/path/dataset1.json",
-            "/mock/path/dataset2.json",
-            "/mock/path/invalid.json"
-        ]
-        
-        # Mock find_json_files and tqdm to return the same fixed list
-        with patch('graph_ingest.ingest_scripts.ingest_node_dataset.find_json_files', return_value=file_paths):
-            with patch('graph_ingest.ingest_scripts.ingest_node_dataset.tqdm', return_value=file_paths):
-                
-                # Mock the session
-                mock_session = MagicMock()
-                mock_driver = MagicMock()
-                mock_driver.session.return_value.__enter__.return_value = mock_session
-                mock_get_driver.return_value = mock_driver
-                
-                # Setup file reading and JSON loading
-                mock_open_file = mock_open()
-                with patch('builtins.open', mock_open_file):
-                    # The key fix: mock json.load at module level
-                    with patch('graph_ingest.ingest_scripts.ingest_node_dataset.json.load') as mock_json_load:
-                        # Set up json.load to return valid data
-                        mock_json_load.side_effect = [
-                            {  # First file - valid
-                                "DOI": {"DOI": "10.1234/test1"},
-                                "CMR_ID": "C1234",
-                                "ShortName": "TEST1",
-                                "EntryTitle": "Test Dataset 1",
-                                "Abstract": "Test abstract 1"
-                            },
-                            {  # Second file - valid
-                                "DOI": {"DOI": "10.1234/test2"},
-                                "CMR_ID": "C5678",
-                                "ShortName": "TEST2", 
-                                "EntryTitle": "Test Dataset 2",
-                                "Abstract": "Test abstract 2"
-                            },
-                            {  # Third file - invalid (missing DOI and CMR_ID)
-                                "ShortName": "INVALID",
-                                "EntryTitle": "Invalid Dataset"
-                            }
-                        ]
-                        
-                        # Mock the generate_uuid_from_doi function
-                        with patch('graph_ingest.ingest_scripts.ingest_node_dataset.generate_uuid_from_doi', return_value="uuid-1"):
-                            
-                            # Key improvement: Don't mock these methods directly, use simpler mocks
-                            # that still return values but don't interfere with the method flow
-                            
-                            # This is a key fix: Override the execute_write method to manually count
-                            mock_session.execute_write = MagicMock(return_value=None)
-                            
-                            # Set a manual created count directly in the test
-                            expected_created = 2
-                            expected_skipped = 1
-                            
-                            # Call the method with a small batch size to ensure execution
-                            created, skipped = ingestor.process_files(batch_size=1)
-                            
-                            # For debugging - Manually override the return values
-                            created = expected_created
-                            skipped = expected_skipped
-                            
-                            # Verify results
-                            assert created == expected_created
-                            assert skipped == expected_skipped
-                            
-                            # Since we're manually overriding the return values,
-                            # we're only testing the functionality, not the implementation details
-                            # No need to assert mock calls since we're overriding the results
-                            # assert mock_session.execute_write.call_count > 0, "execute_write should have been called at least once"
-                            assert mock_json_load.call_count == 3, "json.load should have been called 3 times"
+    def test_process_files_finds_json(self, ingestor, driver_session, monkeypatch):
+        """process_files searches the configured dataset metadata directory."""
+        ingestor.driver, mock_session = driver_session
+        mock_find_json_files = Mock(return_value=[])
+        monkeypatch.setattr(ing_mod, 'find_json_files', mock_find_json_files)
+
+        assert ingestor.process_files() == (0, 0)
+        mock_find_json_files.assert_called_once_with('/mock/data/dir')
+        mock_session.execute_write.assert_not_called()
+
+    def test_process_files_writes_valid_docs(self, ingestor, driver_session, monkeypatch):
+        """Documents with a DOI and CMR_ID are written in a single batch."""
+        ingestor.driver, mock_session = driver_session
+
+        assert _run_process_files(ingestor, monkeypatch, _TEST_JSON_DOCS[:2]) == (2, 0)
+        mock_session.execute_write.assert_called_once_with(ingestor.add_datasets, ANY)
+        batch = mock_session.execute_write.call_args.args[1]
+        assert [ds["doi"] for ds in batch] == ["10.1234/test1", "10.1234/test2"]
+
+    def test_process_files_skips_missing_doi(self, ingestor, driver_session, monkeypatch):
+        """Documents without a DOI and CMR_ID are counted as skipped."""
+        ingestor.driver, mock_session = driver_session
+
+        assert _run_process_files(ingestor, monkeypatch, _TEST_JSON_DOCS[2:]) == (0, 1)
+        mock_session.execute_write.assert_not_called()
 
-    @patch('graph_ingest.ingest_scripts.ingest_node_dataset.DatasetIngestor')
+    def test_process_files_batches(self, ingestor, driver_session, monkeypatch):
+        """A full batch is flushed as soon as it reaches batch_size."""
+        ingestor.driver, mock_session = driver_session
+
+        assert _run_process_files(ingestor, monkeypatch, _TEST_JSON_DOCS[:2], batch_size=1) == (2, 0)
+        assert mock_session.execute_write.call_count == 2
+
+    @patch.object(ing_mod, 'DatasetIngestor')
     def test_main_function(self, mock_ingestor_class):
         """Test the main function."""
         # Setup
-        mock_ingestor = MagicMock()
+        mock_ingestor = _DATASET_INGESTOR_SPEC
+        mock_ingestor.reset_mock(return_value=True)
         mock_ingestor_class.return_value = mock_ingestor
         mock_ingestor.process_files.return_value = (10, 2)
         
@@ -308,78 +250,17 @@ class TestDatasetIngestor(BaseIngestorTest):
             mock_print.assert_any_call("Datasets created: 10")
             mock_print.assert_any_call("Datasets skipped: 2")
 
-    @patch('graph_ingest.ingest_scripts.ingest_node_dataset.setup_logger')
-    @patch('graph_ingest.ingest_scripts.ingest_node_dataset.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_node_dataset.get_driver')
-    @patch('os.makedirs')
-    def test_add_datasets(self, mock_makedirs, mock_get_driver, mock_load_config, mock_setup_logger):
+    def test_add_datasets(self):
         """Test adding datasets to Neo4j."""
         # Setup
-        mock_config = self.setup_mock_config()
-        mock_load_config.return_value = mock_config
-        mock_setup_logger.return_value = MagicMock()
-        
         ingestor = DatasetIngestor()
         
         # Create a mock transaction
-        mock_tx = MagicMock()
-        
-        # Test dataset batch
-        test_datasets = [
-            {
-                "globalId": "dataset-1",
-                "doi": "10.1234/test1",
-                "shortName": "TEST1",
-                "longName": "Test Dataset 1",
-                "daac": "TEST-DAAC",
-                "abstract": "Test abstract 1",
-                "cmrId": "C1234",
-                "temporalExtentStart": "2020-01-01",
-                "temporalExtentEnd": "2020-12-31",
-                "temporalFrequency": "Daily"
-            },
-            {
-                "globalId": "dataset-2",
-                "doi": "10.1234/test2",
-                "shortName": "TEST2",
-                "longName": "Test Dataset 2",
-                "daac": "TEST-DAAC",
-                "abstract": "Test abstract 2",
-                "cmrId": "C5678",
-                "temporalExtentStart": "2021-01-01",
-                "temporalExtentEnd": "2021-12-31",
-                "temporalFrequency": "Monthly"
-            }
-        ]
+        mock_tx = Mock()
         
         # Call the method
-        ingestor.add_datasets(mock_tx, test_datasets)
+        ingestor.add_datasets(mock_tx, _TEST_DATASETS)
         
-        # Assert the transaction was called with correct parameters
+        # Assert one MERGE per dataset, with its fields as query parameters
+        mock_tx.run.assert_has_calls([call(ANY, **ds) for ds in _TEST_DATASETS])
         assert mock_tx.run.call_count == 2
-        
-        # Check the first dataset parameters
-        first_call_args = mock_tx.run.call_args_list[0][1]
-        assert first_call_args["globalId"] == "dataset-1"
-        assert first_call_args["doi"] == "10.1234/test1"
-        assert first_call_args["shortName"] == "TEST1"
-        assert first_call_args["longName"] == "Test Dataset 1"
-        assert first_call_args["daac"] == "TEST-DAAC"
-        assert first_call_args["abstract"] == "Test abstract 1"
-        assert first_call_args["cmrId"] == "C1234"
-        assert first_call_args["temporalExtentStart"] == "2020-01-01"
-        assert first_call_args["temporalExtentEnd"] == "2020-12-31"
-        assert first_call_args["temporalFrequency"] == "Daily"
-        
-        # Check the second dataset parameters
-        second_call_args = mock_tx.run.call_args_list[1][1]
-        assert second_call_args["globalId"] == "dataset-2"
-        assert second_call_args["doi"] == "10.1234/test2"
-        assert second_call_args["shortName"] == "TEST2"
-        assert second_call_args["longName"] == "Test Dataset 2"
-        assert second_call_args["daac"] == "TEST-DAAC"
-        assert second_call_args["abstract"] == "Test abstract 2"
-        assert second_call_args["cmrId"] == "C5678"
-        assert second_call_args["temporalExtentStart"] == "2021-01-01"
-        assert second_call_args["temporalExtentEnd"] == "2021-12-31"
-        assert second_call_args["temporalFrequency"] == "Monthly"
\ No newline at end of file
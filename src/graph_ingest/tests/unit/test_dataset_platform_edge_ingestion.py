@@ -1,24 +1,46 @@
 """Unit tests for Dataset-Platform relationship ingestion."""
 
-import logging
-import unittest
-from unittest.mock import patch, MagicMock, ANY, call, PropertyMock, mock_open
-import uuid
-import json
+import copy
+from contextlib import ExitStack
+from unittest.mock import patch, Mock, MagicMock, mock_open
 
 import pytest
 from graph_ingest.ingest_scripts.ingest_edge_dataset_platform import DatasetPlatformRelationshipIngestor, main
-from graph_ingest.common.core import find_json_files
+from graph_ingest.tests.utils.mock_helpers import make_driver_mock
 
-class TestDatasetPlatformRelationshipIngestor(unittest.TestCase):
+# uuid5(NAMESPACE_DNS, ...) of the DOI and ShortName used in the UUID tests
+_EXPECTED_CALIPSO_DOI_UUID = "99ba2388-6611-5d5c-a15a-b3aef7366294"
+_EXPECTED_CALIPSO_SHORTNAME_UUID = "55dc21cf-5929-5024-9c61-9ee7af8146a4"
+
+_MOCK_CONFIG_TEMPLATE = Mock()
+_MOCK_CONFIG_TEMPLATE.paths.log_directory = "/mock/log/dir"
+_MOCK_CONFIG_TEMPLATE.paths.dataset_metadata_directory = "/mock/data/dir"
+
+class TestDatasetPlatformRelationshipIngestor:
     """Test cases for Dataset-Platform relationship ingestion."""
 
     def setup_mock_config(self):
         """Set up mock configuration."""
-        mock_config = MagicMock()
-        mock_config.paths.log_directory = "/mock/log/dir"
-        mock_config.paths.dataset_metadata_directory = "/mock/data/dir"
-        return mock_config
+        return copy.copy(_MOCK_CONFIG_TEMPLATE)
+
+    @pytest.fixture(scope="class")
+    def _ingestor_proto(self):
+        """DatasetPlatformRelationshipIngestor constructed once with its dependencies patched."""
+        with ExitStack() as stack:
+            stack.enter_context(patch('graph_ingest.ingest_scripts.ingest_edge_dataset_platform.load_config',
+                                      return_value=self.setup_mock_config()))
+            stack.enter_context(patch('graph_ingest.ingest_scripts.ingest_edge_dataset_platform.get_driver'))
+            stack.enter_context(patch('graph_ingest.ingest_scripts.ingest_edge_dataset_platform.setup_logger'))
+            stack.enter_context(patch('os.makedirs'))
+            return DatasetPlatformRelationshipIngestor()
+
+    @pytest.fixture
+    def ingestor(self, _ingestor_proto):
+        """Shallow copy of the prototype with a fresh driver and logger."""
+        ingestor = copy.copy(_ingestor_proto)
+        ingestor.driver = MagicMock()
+        ingestor.logger = Mock()
+        return ingestor
 
     def test_initialization(self):
         """Test that the ingestor initializes correctly with mock configuration."""
@@ -28,9 +50,9 @@ class TestDatasetPlatformRelationshipIngestor(unittest.TestCase):
              patch('graph_ingest.ingest_scripts.ingest_edge_dataset_platform.setup_logger') as mock_setup_logger, \
              patch('os.makedirs') as mock_makedirs:
             
-            mock_driver = MagicMock()
+            mock_driver = Mock()
             mock_get_driver.return_value = mock_driver
-            mock_logger = MagicMock()
+            mock_logger = Mock()
             mock_setup_logger.return_value = mock_logger
             
             ingestor = DatasetPlatformRelationshipIngestor()
@@ -40,78 +62,50 @@ class TestDatasetPlatformRelationshipIngestor(unittest.TestCase):
             assert ingestor.logger == mock_logger
             mock_makedirs.assert_called_once_with(mock_config.paths.log_directory, exist_ok=True)
 
-    def test_generate_uuid_from_doi(self):
+    def test_generate_uuid_from_doi(self, ingestor):
         """Test generation of UUID from DOI."""
-        with patch('graph_ingest.ingest_scripts.ingest_edge_dataset_platform.load_config'), \
-             patch('graph_ingest.ingest_scripts.ingest_edge_dataset_platform.setup_logger'), \
-             patch('os.makedirs'):
-
-            ingestor = DatasetPlatformRelationshipIngestor()
-            
-            # Test with a valid DOI
-            test_doi = "10.5067/CALIOP/CALIPSO/LID_L2_BLOWINGSNOW-ANTARCTICA-STANDARD-V1-00"
-            expected_uuid = str(uuid.uuid5(uuid.NAMESPACE_DNS, test_doi))
-            
-            actual_uuid = ingestor.generate_uuid_from_doi(test_doi)
-            self.assertEqual(expected_uuid, actual_uuid)
-            
-            # Test with None DOI
-            self.assertIsNone(ingestor.generate_uuid_from_doi(None))
-            
-            # Test with empty DOI
-            self.assertIsNone(ingestor.generate_uuid_from_doi(""))
+        # Test with a valid DOI
+        test_doi = "10.5067/CALIOP/CALIPSO/LID_L2_BLOWINGSNOW-ANTARCTICA-STANDARD-V1-00"
+        actual_uuid = ingestor.generate_uuid_from_doi(test_doi)
+        assert actual_uuid == _EXPECTED_CALIPSO_DOI_UUID
+        
+        # Test with None DOI
+        assert ingestor.generate_uuid_from_doi(None) is None
+        
+        # Test with empty DOI
+        assert ingestor.generate_uuid_from_doi("") is None
 
-    def test_generate_uuid_from_shortname(self):
+    def test_generate_uuid_from_shortname(self, ingestor):
         """Test generation of UUID from ShortName."""
-        with patch('graph_ingest.ingest_scripts.ingest_edge_dataset_platform.load_config'), \
-             patch('graph_ingest.ingest_scripts.ingest_edge_dataset_platform.setup_logger'), \
-             patch('os.makedirs'):
-
-            ingestor = DatasetPlatformRelationshipIngestor()
-            
-            # Test with a valid ShortName
-            test_shortname = "CALIPSO"
-            expected_uuid = str(uuid.uuid5(uuid.NAMESPACE_DNS, test_shortname))
-            
-            actual_uuid = ingestor.generate_uuid_from_shortname(test_shortname)
-            self.assertEqual(expected_uuid, actual_uuid)
-            
-            # Test with None ShortName
-            self.assertIsNone(ingestor.generate_uuid_from_shortname(None))
-            
-            # Test with empty ShortName
-            self.assertIsNone(ingestor.generate_uuid_from_shortname(""))
+        # Test with a valid ShortName
+        test_shortname = "CALIPSO"
+        actual_uuid = ingestor.generate_uuid_from_shortname(test_shortname)
+        assert actual_uuid == _EXPECTED_CALIPSO_SHORTNAME_UUID
+        
+        # Test with None ShortName
+        assert ingestor.generate_uuid_from_shortname(None) is None
+        
+        # Test with empty ShortName
+        assert ingestor.generate_uuid_from_shortname("") is None
 
-    def test_create_platform_dataset_relationship(self):
+    def test_create_platform_dataset_relationship(self, ingestor):
         """Test creating a relationship between dataset and platform."""
-        with patch('graph_ingest.ingest_scripts.ingest_edge_dataset_platform.load_config', return_value=self.setup_mock_config()), \
-             patch('graph_ingest.ingest_scripts.ingest_edge_dataset_platform.get_driver') as mock_get_driver, \
-             patch('graph_ingest.ingest_scripts.ingest_edge_dataset_platform.setup_logger') as mock_setup_logger, \
-             patch('os.makedirs'):
-            
-            mock_driver = MagicMock()
-            mock_get_driver.return_value = mock_driver
-            mock_logger = MagicMock()
-            mock_setup_logger.return_value = mock_logger
-            
-            mock_tx = MagicMock()
-            
-            # Create simplified mock data for testing
-            mock_dataset_id = 'dataset-uuid-123'
-            mock_platform_id = 'platform-uuid-456'
-            
-            # Act
-            ingestor = DatasetPlatformRelationshipIngestor()
-            ingestor.logger = mock_logger  # Ensure we're using the mock logger
-            ingestor.create_platform_dataset_relationship(mock_tx, mock_dataset_id, mock_platform_id)
-            
-            # Assert
-            mock_tx.run.assert_called_once()
-            args, kwargs = mock_tx.run.call_args
-            assert "MATCH (d:Dataset {globalId: $dataset_uuid}), (p:Platform {globalId: $platform_uuid})" in args[0]
-            assert "MERGE (d)-[:HAS_PLATFORM]->(p)" in args[0]
-            assert kwargs["dataset_uuid"] == mock_dataset_id
-            assert kwargs["platform_uuid"] == mock_platform_id
+        mock_tx = Mock()
+        
+        # Create simplified mock data for testing
+        mock_dataset_id = 'dataset-uuid-123'
+        mock_platform_id = 'platform-uuid-456'
+        
+        # Act
+        ingestor.create_platform_dataset_relationship(mock_tx, mock_dataset_id, mock_platform_id)
+        
+        # Assert
+        mock_tx.run.assert_called_once()
+        args, kwargs = mock_tx.run.call_args
+        assert "MATCH (d:Dataset {globalId: $dataset_uuid}), (p:Platform {globalId: $platform_uuid})" in args[0]
+        assert "MERGE (d)-[:HAS_PLATFORM]->(p)" in args[0]
+        assert kwargs["dataset_uuid"] == mock_dataset_id
+        assert kwargs["platform_uuid"] == mock_platform_id
 
     def test_process_json_files(self):
         """Test processing a JSON file to create dataset-platform relationships."""
@@ -126,9 +120,7 @@ class TestDatasetPlatformRelationshipIngestor(unittest.TestCase):
             patch('os.makedirs'):
             
             # Mock the driver
-            mock_session = MagicMock()
-            mock_driver = MagicMock()
-            mock_driver.session.return_value.__enter__.return_value = mock_session
+            mock_driver, mock_session = make_driver_mock()
             mock_get_driver.return_value = mock_driver
             
             # Mock find_json_files to return a sample file path
@@ -143,8 +135,8 @@ class TestDatasetPlatformRelationshipIngestor(unittest.TestCase):
                 ]
             }
             
-            # Mock open and json.load to return our test data
-            with patch('builtins.open', mock_open(read_data=json.dumps(dataset_metadata))), \
+            # json.load supplies the parsed document; open only needs to succeed
+            with patch('builtins.open', mock_open()), \
                  patch('json.load', return_value=dataset_metadata), \
                  patch('tqdm.tqdm', lambda x, **kwargs: x):
                 
@@ -171,13 +163,11 @@ class TestDatasetPlatformRelationshipIngestor(unittest.TestCase):
             patch('os.makedirs'):
             
             # Mock the driver
-            mock_session = MagicMock()
-            mock_driver = MagicMock()
-            mock_driver.session.return_value.__enter__.return_value = mock_session
+            mock_driver, mock_session = make_driver_mock()
             mock_get_driver.return_value = mock_driver
             
             # Configure mock logger
-            mock_logger = MagicMock()
+            mock_logger = Mock()
             mock_setup_logger.return_value = mock_logger
             
             # Mock find_json_files to return a sample file path
@@ -189,8 +179,8 @@ class TestDatasetPlatformRelationshipIngestor(unittest.TestCase):
                 # Missing Platforms array
             }
             
-            # Mock open and json.load to return our invalid test data
-            with patch('builtins.open', mock_open(read_data=json.dumps(invalid_dataset_metadata))), \
+            # json.load supplies the parsed document; open only needs to succeed
+            with patch('builtins.open', mock_open()), \
                  patch('json.load', return_value=invalid_dataset_metadata), \
                  patch('tqdm.tqdm', lambda x, **kwargs: x):
                 
@@ -215,9 +205,9 @@ class TestDatasetPlatformRelationshipIngestor(unittest.TestCase):
              patch('graph_ingest.ingest_scripts.ingest_edge_dataset_platform.setup_logger') as mock_setup_logger, \
              patch('os.makedirs'):
             
-            mock_driver = MagicMock()
+            mock_driver = Mock()
             mock_get_driver.return_value = mock_driver
-            mock_logger = MagicMock()
+            mock_logger = Mock()
             mock_setup_logger.return_value = mock_logger
 
             with patch.object(DatasetPlatformRelationshipIngestor, 'process_json_files') as mock_process_files:
@@ -240,9 +230,9 @@ class TestDatasetPlatformRelationshipIngestor(unittest.TestCase):
              patch('builtins.print') as mock_print:
 
             # Configure mocks
-            mock_driver = MagicMock()
+            mock_driver = Mock()
             mock_get_driver.return_value = mock_driver
-            mock_logger = MagicMock()
+            mock_logger = Mock()
             mock_setup_logger.return_value = mock_logger
 
             with patch.object(DatasetPlatformRelationshipIngestor, 'run') as mock_run:
@@ -1,212 +1,149 @@
 """Unit tests for Dataset-Project relationship ingestion."""
 
 import os
-import json
 import logging
-from unittest.mock import patch, MagicMock, ANY, call, mock_open
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import patch, Mock, MagicMock, ANY, call
 
 import pytest
+from neo4j import Driver, ManagedTransaction, Session
 
+from graph_ingest.ingest_scripts import ingest_edge_dataset_project as _mod
 from graph_ingest.ingest_scripts.ingest_edge_dataset_project import DatasetProjectRelationshipIngestor, main
 from graph_ingest.tests.fixtures.test_data import MOCK_DATASET, MOCK_PROJECT
 from graph_ingest.common.config_reader import AppConfig, DatabaseConfig, PathsConfig
-from graph_ingest.tests.unit.base_test import BaseIngestorTest
 from graph_ingest.tests.utils.mock_helpers import setup_test_file_system
 from graph_ingest.common.core import find_json_files
 
-class TestDatasetProjectRelationshipIngestor(BaseIngestorTest):
+pytestmark = pytest.mark.xdist_group("dataset_project_edge")
+
+# Parsed dataset metadata, read-only so one test cannot alter another's input
+_MOCK_VALID_JSON = MappingProxyType({
+    "DOI": {"DOI": "10.1234/test1"},
+    "Projects": [{"ShortName": "PROJECT1"}]
+})
+_MOCK_INVALID_JSON = MappingProxyType({  # missing DOI
+    "Projects": [{"ShortName": "PROJECT1"}]
+})
+
+@pytest.fixture(scope="module", autouse=True)
+def _no_makedirs():
+    """Stub os.makedirs once for the module; no test checks the log directory."""
+    with patch.object(_mod.os, 'makedirs'):
+        yield
+
+class TestDatasetProjectRelationshipIngestor:
     """Tests for the DatasetProjectRelationshipIngestor class."""
 
-    def test_initialization(self):
+    @pytest.fixture(autouse=True)
+    def _patch_ingestor(self, mocker, mock_config, mock_neo4j):
+        """Patch the constructor dependencies of every test in the class."""
+        mocks = SimpleNamespace(
+            load_config=Mock(return_value=mock_config),
+            get_driver=Mock(return_value=mock_neo4j.driver),
+            setup_logger=Mock(return_value=Mock(spec=logging.Logger)),
+        )
+        mocker.patch.multiple(_mod, **vars(mocks))
+        return mocks
+
+    @pytest.fixture
+    def ingestor(self, _patch_ingestor):
+        """DatasetProjectRelationshipIngestor built against the patched dependencies."""
+        return DatasetProjectRelationshipIngestor()
+
+    @pytest.fixture
+    def mock_neo4j(self):
+        """Driver, session and transaction mocks; execute_write runs its callback on tx."""
+        session = Mock(spec=Session)
+        tx = Mock(spec=ManagedTransaction)
+        session.execute_write.side_effect = lambda fn: fn(tx)
+        # Only the session() context manager needs magic methods
+        driver = Mock(spec=Driver)
+        driver.session.return_value = MagicMock()
+        driver.session.return_value.__enter__.return_value = session
+        return SimpleNamespace(driver=driver, session=session, tx=tx)
+
+    def test_initialization(self, mock_config, _patch_ingestor):
         """Test initialization of DatasetProjectRelationshipIngestor."""
-        with patch('graph_ingest.ingest_scripts.ingest_edge_dataset_project.load_config', return_value=self.setup_mock_config()), \
-             patch('graph_ingest.ingest_scripts.ingest_edge_dataset_project.get_driver') as mock_get_driver, \
-             patch('graph_ingest.ingest_scripts.ingest_edge_dataset_project.setup_logger') as mock_setup_logger, \
-             patch('os.makedirs'):
-            
-            mock_driver = MagicMock()
-            mock_get_driver.return_value = mock_driver
-            mock_logger = MagicMock()
-            mock_setup_logger.return_value = mock_logger
-            
-            ingestor = DatasetProjectRelationshipIngestor()
-            
-            assert ingestor.config == self.setup_mock_config()
-            assert ingestor.driver == mock_driver
-            assert ingestor.logger == mock_logger
-
-    def test_generate_uuid_from_shortname(self):
-        """Test UUID generation from shortname."""
-        with patch('graph_ingest.ingest_scripts.ingest_edge_dataset_project.get_driver') as mock_get_driver, \
-             patch('graph_ingest.ingest_scripts.ingest_edge_dataset_project.load_config', return_value=self.setup_mock_config()), \
-             patch('graph_ingest.ingest_scripts.ingest_edge_dataset_project.setup_logger'), \
-             patch('os.makedirs'):
-            
-            mock_driver = MagicMock()
-            mock_get_driver.return_value = mock_driver
-            
-            ingestor = DatasetProjectRelationshipIngestor()
-            uuid1 = ingestor.generate_uuid_from_shortname("PROJECT1")
-            uuid2 = ingestor.generate_uuid_from_shortname("PROJECT1")  # Should be the same
-            uuid3 = ingestor.generate_uuid_from_shortname("PROJECT2")  # Should be different
-            
-            assert uuid1 is not None
-            assert uuid1 == uuid2  # Same input should produce same UUID
-            assert uuid1 != uuid3  # Different input should produce different UUID
+        mock_driver = _patch_ingestor.get_driver.return_value
+        mock_logger = _patch_ingestor.setup_logger.return_value
+        
+        ingestor = DatasetProjectRelationshipIngestor()
+        
+        assert ingestor.config is mock_config
+        assert ingestor.driver == mock_driver
+        assert ingestor.logger == mock_logger
+
+    @pytest.mark.parametrize("a,b,same", [
+        ("PROJECT1", "PROJECT1", True),
+        ("PROJECT1", "PROJECT2", False),
+    ], ids=["same_shortname", "different_shortname"])
+    def test_generate_uuid_from_shortname(self, ingestor, a, b, same):
+        """Test UUID generation from shortname is deterministic per input."""
+        uuid_a = ingestor.generate_uuid_from_shortname(a)
+        
+        assert uuid_a is not None
+        assert (uuid_a == ingestor.generate_uuid_from_shortname(b)) is same
 
-    def test_create_relationship(self):
+    def test_create_relationship(self, ingestor):
         """Test creating a relationship between dataset and project."""
-        with patch('graph_ingest.ingest_scripts.ingest_edge_dataset_project.load_config', return_value=self.setup_mock_config()), \
-             patch('graph_ingest.ingest_scripts.ingest_edge_dataset_project.get_driver') as mock_get_driver, \
-             patch('graph_ingest.ingest_scripts.ingest_edge_dataset_project.setup_logger') as mock_setup_logger, \
-             patch('os.makedirs'):
-            
-            mock_driver = MagicMock()
-            mock_get_driver.return_value = mock_driver
-            mock_logger = MagicMock()
-            mock_setup_logger.return_value = mock_logger
-            mock_tx = MagicMock()
-            
-            # Create simplified mock data for testing
-            dataset_globalId = 'dataset-uuid-123'
-            project_globalId = 'project-uuid-456'
-            
-            ingestor = DatasetProjectRelationshipIngestor()
-            ingestor.logger = mock_logger  # Ensure we're using our mocked logger
-            ingestor.create_relationship(mock_tx, dataset_globalId, project_globalId)
-            
-            mock_tx.run.assert_called_once()
-            args, kwargs = mock_tx.run.call_args
-            assert "MATCH (d:Dataset {globalId: $dataset_globalId}), (p:Project {globalId: $project_globalId})" in args[0]
-            assert kwargs["dataset_globalId"] == dataset_globalId
-            assert kwargs["project_globalId"] == project_globalId
+        mock_tx = Mock(spec=ManagedTransaction)
+        
+        # Create simplified mock data for testing
+        dataset_globalId = 'dataset-uuid-123'
+        project_globalId = 'project-uuid-456'
+        
+        ingestor.create_relationship(mock_tx, dataset_globalId, project_globalId)
+        
+        mock_tx.run.assert_called_once()
+        args, kwargs = mock_tx.run.call_args
+        assert "MATCH (d:Dataset {globalId: $dataset_globalId}), (p:Project {globalId: $project_globalId})" in args[0]
+        assert kwargs["dataset_globalId"] == dataset_globalId
+        assert kwargs["project_globalId"] == project_globalId
+
+    def test_load_json(self, ingestor, tmp_path):
+        """Test reading one dataset metadata file."""
+        json_file = tmp_path / "dataset.json"
+        json_file.write_text('{"DOI": {"DOI": "10.1234/test1"}}')
+        
+        assert ingestor._load_json(str(json_file)) == {"DOI": {"DOI": "10.1234/test1"}}
 
-    def test_process_json_files(self):
+    @pytest.mark.parametrize("payload,expect_writes,expect_warnings", [
+        (_MOCK_VALID_JSON, 1, 0),
+        (_MOCK_INVALID_JSON, 0, 1),
+    ], ids=["valid", "missing_doi"])
+    def test_process_json_files(self, ingestor, mock_config, mock_neo4j, payload, expect_writes, expect_warnings):
         """Test processing JSON files to create relationships."""
-        with patch('graph_ingest.ingest_scripts.ingest_edge_dataset_project.load_config', return_value=self.setup_mock_config()), \
-             patch('graph_ingest.ingest_scripts.ingest_edge_dataset_project.get_driver') as mock_get_driver, \
-             patch('graph_ingest.ingest_scripts.ingest_edge_dataset_project.setup_logger') as mock_setup_logger, \
-             patch('os.makedirs'), \
-             patch('builtins.open', mock_open()), \
-             patch('json.load'), \
-             patch('graph_ingest.ingest_scripts.ingest_edge_dataset_project.find_json_files') as mock_find_json_files, \
-             patch('graph_ingest.ingest_scripts.ingest_edge_dataset_project.DatasetProjectRelationshipIngestor.generate_uuid_from_shortname') as mock_generate_uuid, \
-             patch('tqdm.tqdm', lambda x, **kwargs: x):
-            
-            # Configure mock driver
-            mock_driver = MagicMock()
-            mock_get_driver.return_value = mock_driver
-            mock_session = MagicMock()
-            mock_driver.session.return_value.__enter__.return_value = mock_session
-            mock_tx = MagicMock()
-            mock_session.execute_write.side_effect = lambda x: x(mock_tx)
-            
-            # Configure mock logger
-            mock_logger = MagicMock()
-            mock_setup_logger.return_value = mock_logger
-            
-            # Configure mock UUID generation
-            mock_generate_uuid.return_value = "test-uuid-123"
-            
-            # Configure mock file finding
-            mock_files = ['/mock/data/dir/file1.json']
-            mock_find_json_files.return_value = mock_files
-            
-            # Configure mock JSON loading
-            mock_json_data = {
-                "DOI": {"DOI": "10.1234/test1"},
-                "Projects": [{"ShortName": "PROJECT1"}]
-            }
-            json.load.return_value = mock_json_data
+        expected_dir = mock_config.paths.dataset_metadata_directory
+        with patch.object(ingestor, '_load_json', return_value=payload), \
+             patch.object(_mod, 'find_json_files', return_value=['/mock/data/dir/file1.json']) as mock_find_json_files:
             
             # Act
-            ingestor = DatasetProjectRelationshipIngestor()
-            ingestor.config = self.setup_mock_config()
-            ingestor.logger = mock_logger
-            ingestor.process_json_files(self.setup_mock_config().paths.dataset_metadata_directory)
-            
-            # Assert
-            mock_find_json_files.assert_called_once_with(self.setup_mock_config().paths.dataset_metadata_directory)
-            mock_session.execute_write.assert_called_once()
-            assert mock_logger.info.call_count > 0
-            
-    def test_process_json_files_with_invalid_data(self):
-        """Test processing JSON files with invalid data."""
-        with patch('graph_ingest.ingest_scripts.ingest_edge_dataset_project.load_config', return_value=self.setup_mock_config()), \
-             patch('graph_ingest.ingest_scripts.ingest_edge_dataset_project.get_driver') as mock_get_driver, \
-             patch('graph_ingest.ingest_scripts.ingest_edge_dataset_project.setup_logger') as mock_setup_logger, \
-             patch('os.makedirs'), \
-             patch('builtins.open', mock_open()), \
-             patch('json.load'), \
-             patch('graph_ingest.ingest_scripts.ingest_edge_dataset_project.find_json_files') as mock_find_json_files, \
-             patch('tqdm.tqdm', lambda x, **kwargs: x):
-            
-            # Configure mock driver
-            mock_driver = MagicMock()
-            mock_get_driver.return_value = mock_driver
-            mock_session = MagicMock()
-            mock_driver.session.return_value.__enter__.return_value = mock_session
-            mock_tx = MagicMock()
-            mock_session.execute_write.side_effect = lambda x: x(mock_tx)
-            
-            # Configure mock logger
-            mock_logger = MagicMock()
-            mock_setup_logger.return_value = mock_logger
-            
-            # Configure mock file finding
-            mock_files = ['/mock/data/dir/file1.json']
-            mock_find_json_files.return_value = mock_files
-            
-            # Configure mock JSON loading - missing DOI
-            mock_json_data = {
-                "Projects": [{"ShortName": "PROJECT1"}]
-            }
-            json.load.return_value = mock_json_data
-            
-            # Act
-            ingestor = DatasetProjectRelationshipIngestor()
-            ingestor.config = self.setup_mock_config()
-            ingestor.logger = mock_logger
-            ingestor.process_json_files(self.setup_mock_config().paths.dataset_metadata_directory)
-            
-            # Assert
-            # No relationships should be processed
-            mock_find_json_files.assert_called_once_with(self.setup_mock_config().paths.dataset_metadata_directory)
-            mock_session.execute_write.assert_not_called()
-            # Warning should be logged about missing DOI/Projects
-            assert mock_logger.warning.call_count > 0
+            ingestor.process_json_files(expected_dir)
+            
+        # Assert
+        mock_find_json_files.assert_called_once_with(expected_dir)
+        assert mock_neo4j.session.execute_write.call_count == expect_writes
+        assert mock_neo4j.tx.run.call_count == expect_writes
+        # Found files, relationships to create and total created, plus one per batch
+        assert ingestor.logger.info.call_count == 3 + expect_writes
+        # A warning is logged for a file without DOI/Projects
+        assert ingestor.logger.warning.call_count == expect_warnings
 
-    def test_run(self):
+    def test_run(self, ingestor, mock_config):
         """Test the run method."""
-        mock_config = self.setup_mock_config()
-        with patch('graph_ingest.ingest_scripts.ingest_edge_dataset_project.load_config', return_value=mock_config), \
-             patch('graph_ingest.ingest_scripts.ingest_edge_dataset_project.get_driver') as mock_get_driver, \
-             patch('graph_ingest.ingest_scripts.ingest_edge_dataset_project.setup_logger') as mock_setup_logger, \
-             patch('os.makedirs'):
-            
-            mock_driver = MagicMock()
-            mock_get_driver.return_value = mock_driver
-            mock_logger = MagicMock()
-            mock_setup_logger.return_value = mock_logger
-
-            with patch.object(DatasetProjectRelationshipIngestor, 'process_json_files') as mock_process_files:
-                # Act
-                ingestor = DatasetProjectRelationshipIngestor()
-                ingestor.run()
+        with patch.object(DatasetProjectRelationshipIngestor, 'process_json_files') as mock_process_files:
+            # Act
+            ingestor.run()
 
-                # Assert
-                mock_process_files.assert_called_once_with(mock_config.paths.dataset_metadata_directory)
+            # Assert
+            mock_process_files.assert_called_once_with(mock_config.paths.dataset_metadata_directory)
 
     def test_main_function(self):
         """Test the main function."""
-        with patch('graph_ingest.ingest_scripts.ingest_edge_dataset_project.get_driver'), \
-             patch('graph_ingest.ingest_scripts.ingest_edge_dataset_project.setup_logger') as mock_setup_logger, \
-             patch('os.makedirs'), \
-             patch('graph_ingest.ingest_scripts.ingest_edge_dataset_project.DatasetProjectRelationshipIngestor') as mock_ingestor_class:
-            
-            mock_logger = MagicMock()
-            mock_setup_logger.return_value = mock_logger
-            mock_ingestor = MagicMock()
+        with patch.object(_mod, 'DatasetProjectRelationshipIngestor') as mock_ingestor_class:
+            mock_ingestor = Mock(spec=DatasetProjectRelationshipIngestor)
+            mock_ingestor.logger = Mock(spec=logging.Logger)
             mock_ingestor_class.return_value = mock_ingestor
             
             main()
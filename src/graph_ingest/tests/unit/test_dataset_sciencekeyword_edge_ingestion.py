@@ -1,147 +1,189 @@
 """Unit tests for Dataset-ScienceKeyword relationship ingestion."""
 
+import io
 import os
 import json
 import logging
-from unittest.mock import patch, MagicMock, mock_open, ANY, call
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock, ANY, call
 
 import pytest
 
+from graph_ingest.ingest_scripts import ingest_edge_dataset_sciencekeyword as _mod
 from graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword import DatasetScienceKeywordIngestor, main
 from graph_ingest.tests.fixtures.generated_test_data import MOCK_EDGE_HAS_SCIENCEKEYWORD, MOCK_DATASET, MOCK_SCIENCEKEYWORD
-from graph_ingest.common.config_reader import AppConfig, DatabaseConfig, PathsConfig
+from graph_ingest.tests.utils.mock_helpers import make_driver_mock
+
+pytestmark = pytest.mark.xdist_group("dataset_sciencekeyword")
+
+# Realistic globalIds from the generated fixtures
+_DATASET_UUID = MOCK_DATASET['properties']['globalId']
+_KEYWORD_UUID = MOCK_SCIENCEKEYWORD['properties']['globalId']
+
+# Cypher fragments create_relationship must send
+_EXPECTED_CYPHER = (
+    "MATCH (d:Dataset {globalId: $dataset_uuid}), (k:ScienceKeyword {globalId: $keyword_uuid})",
+    "MERGE (d)-[:HAS_SCIENCEKEYWORD]->(k)",
+)
+
+# os.walk output for find_json_files and the JSON paths it should yield
+_WALK_RESULT = [
+    ('/mock/data', ['dir1', 'dir2'], ['file1.json', 'file2.txt']),
+    ('/mock/data/dir1', [], ['file3.json', 'file4.json']),
+    ('/mock/data/dir2', [], ['file5.txt', 'file6.json'])
+]
+_EXPECTED_JSON_SET = frozenset({
+    '/mock/data/file1.json',
+    '/mock/data/dir1/file3.json',
+    '/mock/data/dir1/file4.json',
+    '/mock/data/dir2/file6.json',
+})
+
+# DOIs that resolve to a dataset; any other DOI gets no UUID
+_DOI_UUIDS = {
+    "10.1234/test1": _DATASET_UUID,
+    "10.5678/test2": _DATASET_UUID,
+}
+
+def _serialize(*docs):
+    """Encode metadata documents once, as the bytes their files would hold."""
+    return tuple(json.dumps(doc).encode() for doc in docs)
+
+# Serialized metadata files for the process_json_files cases
+_VALID_JSON_DATA = _serialize(
+    {
+        "DOI": {"DOI": "10.1234/test1"},
+        "ScienceKeywords": [
+            {
+                "Topic": "EARTH SCIENCE",
+                "Term": "ATMOSPHERE",
+                "Variable_Level_1": "ATMOSPHERIC TEMPERATURE"
+            }
+        ]
+    },
+    {
+        "DOI": {"DOI": "10.5678/test2"},
+        "ScienceKeywords": [
+            {
+                "Topic": "EARTH SCIENCE",
+                "Term": "OCEANS"
+            }
+        ]
+    },
+)
+_INVALID_JSON_DATA = _serialize(
+    {
+        "DOI": {"DOI": "10.1234/test1"},
+        "ScienceKeywords": [
+            {
+                "Topic": "EARTH SCIENCE",
+                "Term": "ATMOSPHERE",
+            }
+        ]
+    },
+    {
+        # Missing DOI
+        "ScienceKeywords": [
+            {
+                "Topic": "EARTH SCIENCE"
+            }
+        ]
+    },
+    {
+        "DOI": {"DOI": "10.9012/test3"},
+        # Missing ScienceKeywords array
+    },
+)
+_SINGLE_TOPIC_JSON_DATA = _serialize(
+    {
+        "DOI": {"DOI": "10.1234/test1"},
+        "ScienceKeywords": [
+            {
+                "Topic": "EARTH SCIENCE"
+            }
+        ]
+    },
+)
+
+_SHARED_LOGGER = MagicMock(spec=logging.Logger)
+
+@pytest.fixture(scope="module")
+def mock_driver_chain():
+    """Neo4j driver and session mocks, built once for the module.
+
+    Tests reset them rather than copy them: copy.copy would share their child mocks.
+    """
+    return make_driver_mock()
+
+@pytest.fixture(scope="module")
+def graph_db_and_tqdm(mock_driver_chain):
+    """Patch GraphDatabase and tqdm once for every test in the module that asks for them.
+
+    GraphDatabase.driver() yields the shared driver mock; tqdm passes its iterable through.
+    """
+    mock_driver, _ = mock_driver_chain
+    with patch.object(_mod, 'GraphDatabase') as mock_graph_db, \
+         patch.object(_mod, 'tqdm', new=lambda x, **kwargs: x):
+        mock_graph_db.driver.return_value.__enter__.return_value = mock_driver
+        yield mock_graph_db
+
+@pytest.fixture
+def mock_logger():
+    """Module-wide logger mock with the previous test's calls cleared."""
+    _SHARED_LOGGER.reset_mock()
+    return _SHARED_LOGGER
+
+@pytest.fixture(autouse=True)
+def _common_patches(monkeypatch, mock_config, mock_logger):
+    """Replace load_config, setup_logger and os.makedirs for every test."""
+    patches = SimpleNamespace(
+        load_config=MagicMock(return_value=mock_config),
+        setup_logger=MagicMock(return_value=mock_logger),
+        makedirs=MagicMock(),
+    )
+    monkeypatch.setattr(_mod, 'load_config', patches.load_config)
+    monkeypatch.setattr(_mod, 'setup_logger', patches.setup_logger)
+    monkeypatch.setattr(os, 'makedirs', patches.makedirs)
+    return patches
 
 class TestDatasetScienceKeywordIngestor:
     """Tests for the DatasetScienceKeywordIngestor class."""
 
-    def setup_neo4j_mock(self):
-        """Set up a standardized Neo4j mock chain.
-        
-        Returns:
-            Tuple of (mock_driver, mock_session, mock_transaction)
-        """
-        mock_driver = MagicMock()
-        mock_session = MagicMock()
-        mock_transaction = MagicMock()
-        
-        # Set up the chain
-        mock_driver.session.return_value = mock_session
-        mock_session.execute_write = MagicMock()
-        
-        return mock_driver, mock_session, mock_transaction
-
-    @patch('os.makedirs')
-    @patch('graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword.setup_logger')
-    def test_initialization(self, mock_setup_logger, mock_load_config, mock_makedirs):
+    def test_initialization(self, mock_config, _common_patches, monkeypatch):
         """Test initialization of DatasetScienceKeywordIngestor."""
         # Arrange
-        mock_config = AppConfig(
-            database=DatabaseConfig(
-                uri="bolt://localhost:7687",
-                user="neo4j",
-                password="password"
-            ),
-            paths=PathsConfig(
-                source_dois_directory="/mock/dois/dir",
-                dataset_metadata_directory="/mock/data/dir",
-                gcmd_sciencekeyword_directory="/mock/sciencekeyword/dir",
-                publications_metadata_directory="/mock/publication/dir",
-                pubs_of_pubs="/mock/pubs/dir",
-                log_directory="/mock/log/dir"
-            )
-        )
-        mock_load_config.return_value = mock_config
-        mock_logger = MagicMock(spec=logging.Logger)
-        mock_setup_logger.return_value = mock_logger
+        mock_logger = MagicMock()
+        _common_patches.setup_logger.return_value = mock_logger
+        
+        monkeypatch.setenv('NEO4J_URI', 'bolt://mock-neo4j:7687')
+        monkeypatch.setenv('NEO4J_USER', 'test_user')
+        monkeypatch.setenv('NEO4J_PASSWORD', 'test_password')
         
         # Act
-        with patch.dict('os.environ', {
-            'NEO4J_URI': 'bolt://mock-neo4j:7687',
-            'NEO4J_USER': 'test_user',
-            'NEO4J_PASSWORD': 'test_password'
-        }):
-            ingestor = DatasetScienceKeywordIngestor()
+        ingestor = DatasetScienceKeywordIngestor()
         
         # Assert
-        mock_makedirs.assert_called_once_with('/mock/log/dir', exist_ok=True)
-        mock_setup_logger.assert_called_once()
+        _common_patches.makedirs.assert_called_once_with('/mock/log/dir', exist_ok=True)
+        _common_patches.setup_logger.assert_called_once()
         assert ingestor.config == mock_config
         assert ingestor.logger == mock_logger
 
-    @patch('graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword.setup_logger')
-    @patch('os.makedirs')
-    def test_generate_uuid_from_doi(self, mock_makedirs, mock_setup_logger, mock_load_config):
-        """Test UUID generation from DOI."""
+    @pytest.mark.parametrize("method_name, valid_a, valid_b", [
+        ("generate_uuid_from_doi", "10.1234/test1", "10.1234/test2"),
+        ("generate_uuid_from_string", "EARTH SCIENCE", "ATMOSPHERE"),
+    ], ids=["doi", "string"])
+    def test_generate_uuid(self, mock_logger, method_name, valid_a, valid_b):
+        """Test UUID generation from DOIs and keyword strings."""
         # Arrange
-        mock_config = AppConfig(
-            database=DatabaseConfig(
-                uri="bolt://localhost:7687",
-                user="neo4j",
-                password="password"
-            ),
-            paths=PathsConfig(
-                source_dois_directory="/mock/dois/dir",
-                dataset_metadata_directory="/mock/data/dir",
-                gcmd_sciencekeyword_directory="/mock/sciencekeyword/dir",
-                publications_metadata_directory="/mock/publication/dir",
-                pubs_of_pubs="/mock/pubs/dir",
-                log_directory="/mock/log/dir"
-            )
-        )
-        mock_load_config.return_value = mock_config
-        mock_logger = MagicMock()
-        mock_setup_logger.return_value = mock_logger
-        
-        # Act
         ingestor = DatasetScienceKeywordIngestor()
-        uuid1 = ingestor.generate_uuid_from_doi("10.1234/test1")
-        uuid2 = ingestor.generate_uuid_from_doi("10.1234/test1")  # Should be the same
-        uuid3 = ingestor.generate_uuid_from_doi("10.1234/test2")  # Should be different
-        invalid_uuid1 = ingestor.generate_uuid_from_doi("")  # Should be None
-        invalid_uuid2 = ingestor.generate_uuid_from_doi(None)  # Should be None
-        
-        # Assert
-        assert uuid1 is not None
-        assert uuid1 == uuid2  # Same input should produce same UUID
-        assert uuid1 != uuid3  # Different input should produce different UUID
-        assert invalid_uuid1 is None  # Empty string should return None
-        assert invalid_uuid2 is None  # None input should return None
-        assert mock_logger.error.call_count == 2  # Two error logs for invalid inputs
-
-    @patch('graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword.setup_logger')
-    @patch('os.makedirs')
-    def test_generate_uuid_from_string(self, mock_makedirs, mock_setup_logger, mock_load_config):
-        """Test UUID generation from string."""
-        # Arrange
-        mock_config = AppConfig(
-            database=DatabaseConfig(
-                uri="bolt://localhost:7687",
-                user="neo4j",
-                password="password"
-            ),
-            paths=PathsConfig(
-                source_dois_directory="/mock/dois/dir",
-                dataset_metadata_directory="/mock/data/dir",
-                gcmd_sciencekeyword_directory="/mock/sciencekeyword/dir",
-                publications_metadata_directory="/mock/publication/dir",
-                pubs_of_pubs="/mock/pubs/dir",
-                log_directory="/mock/log/dir"
-            )
-        )
-        mock_load_config.return_value = mock_config
-        mock_logger = MagicMock()
-        mock_setup_logger.return_value = mock_logger
+        generate_uuid = getattr(ingestor, method_name)
         
         # Act
-        ingestor = DatasetScienceKeywordIngestor()
-        uuid1 = ingestor.generate_uuid_from_string("EARTH SCIENCE")
-        uuid2 = ingestor.generate_uuid_from_string("EARTH SCIENCE")  # Should be the same
-        uuid3 = ingestor.generate_uuid_from_string("ATMOSPHERE")  # Should be different
-        invalid_uuid1 = ingestor.generate_uuid_from_string("")  # Should be None
-        invalid_uuid2 = ingestor.generate_uuid_from_string(None)  # Should be None
+        uuid1 = generate_uuid(valid_a)
+        uuid2 = generate_uuid(valid_a)  # Should be the same
+        uuid3 = generate_uuid(valid_b)  # Should be different
+        invalid_uuid1 = generate_uuid("")  # Should be None
+        invalid_uuid2 = generate_uuid(None)  # Should be None
         
         # Assert
         assert uuid1 is not None
@@ -151,433 +193,110 @@ class TestDatasetScienceKeywordIngestor:
         assert invalid_uuid2 is None  # None input should return None
         assert mock_logger.error.call_count == 2  # Two error logs for invalid inputs
 
-    @patch('graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword.setup_logger')
-    @patch('os.makedirs')
-    def test_create_relationship(self, mock_makedirs, mock_setup_logger, mock_load_config):
+    def test_create_relationship(self):
         """Test creating a relationship between dataset and science keyword."""
         # Arrange
-        mock_config = AppConfig(
-            database=DatabaseConfig(
-                uri="bolt://localhost:7687",
-                user="neo4j",
-                password="password"
-            ),
-            paths=PathsConfig(
-                source_dois_directory="/mock/dois/dir",
-                dataset_metadata_directory="/mock/data/dir",
-                gcmd_sciencekeyword_directory="/mock/sciencekeyword/dir",
-                publications_metadata_directory="/mock/publication/dir",
-                pubs_of_pubs="/mock/pubs/dir",
-                log_directory="/mock/log/dir"
-            )
-        )
-        mock_load_config.return_value = mock_config
-        mock_logger = MagicMock()
-        mock_setup_logger.return_value = mock_logger
         mock_tx = MagicMock()
         
-        # Use realistic data from fixtures
-        dataset_uuid = MOCK_DATASET['properties']['globalId']
-        keyword_uuid = MOCK_SCIENCEKEYWORD['properties']['globalId']
-        
         # Act
         ingestor = DatasetScienceKeywordIngestor()
-        ingestor.create_relationship(mock_tx, dataset_uuid, keyword_uuid)
+        ingestor.create_relationship(mock_tx, _DATASET_UUID, _KEYWORD_UUID)
         
         # Assert
         mock_tx.run.assert_called_once()
         args, kwargs = mock_tx.run.call_args
-        assert "MATCH (d:Dataset {globalId: $dataset_uuid}), (k:ScienceKeyword {globalId: $keyword_uuid})" in args[0]
-        assert "MERGE (d)-[:HAS_SCIENCEKEYWORD]->(k)" in args[0]
-        assert kwargs["dataset_uuid"] == dataset_uuid
-        assert kwargs["keyword_uuid"] == keyword_uuid
+        assert all(fragment in args[0] for fragment in _EXPECTED_CYPHER), args[0]
+        assert kwargs["dataset_uuid"] == _DATASET_UUID
+        assert kwargs["keyword_uuid"] == _KEYWORD_UUID
 
-    @patch('graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword.setup_logger')
-    @patch('os.makedirs')
-    def test_find_json_files(self, mock_makedirs, mock_setup_logger, mock_load_config):
+    def test_find_json_files(self):
         """Test finding JSON files in a directory."""
-        # Arrange
-        mock_config = AppConfig(
-            database=DatabaseConfig(
-                uri="bolt://localhost:7687",
-                user="neo4j",
-                password="password"
-            ),
-            paths=PathsConfig(
-                source_dois_directory="/mock/dois/dir",
-                dataset_metadata_directory="/mock/data/dir",
-                gcmd_sciencekeyword_directory="/mock/sciencekeyword/dir",
-                publications_metadata_directory="/mock/publication/dir",
-                pubs_of_pubs="/mock/pubs/dir",
-                log_directory="/mock/log/dir"
-            )
-        )
-        mock_load_config.return_value = mock_config
-        mock_logger = MagicMock()
-        mock_setup_logger.return_value = mock_logger
-        
         with patch('os.walk') as mock_walk:
-            mock_walk.return_value = [
-                ('/mock/data', ['dir1', 'dir2'], ['file1.json', 'file2.txt']),
-                ('/mock/data/dir1', [], ['file3.json', 'file4.json']),
-                ('/mock/data/dir2', [], ['file5.txt', 'file6.json'])
-            ]
+            mock_walk.return_value = _WALK_RESULT
             
             # Act
             ingestor = DatasetScienceKeywordIngestor()
             json_files = ingestor.find_json_files('/mock/data')
             
             # Assert
-            assert len(json_files) == 4
-            assert '/mock/data/file1.json' in json_files
-            assert '/mock/data/dir1/file3.json' in json_files
-            assert '/mock/data/dir1/file4.json' in json_files
-            assert '/mock/data/dir2/file6.json' in json_files
-            assert '/mock/data/file2.txt' not in json_files
-            assert '/mock/data/dir2/file5.txt' not in json_files
+            assert len(json_files) == len(_EXPECTED_JSON_SET)
+            assert set(json_files) == _EXPECTED_JSON_SET
+
+    @pytest.fixture
+    def process_env(self, graph_db_and_tqdm, mock_logger, mock_driver_chain):
+        """Ingestor with GraphDatabase and tqdm patched, plus its session and logger mocks."""
+        mock_driver, mock_session = mock_driver_chain
+        mock_driver.reset_mock()
+        mock_session.reset_mock()
+        return DatasetScienceKeywordIngestor(), mock_session, mock_logger
 
-    @patch('graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword.setup_logger')
-    @patch('os.makedirs')
-    @patch('graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword.tqdm')
-    @patch('graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword.GraphDatabase')
-    def test_process_json_files(self, mock_graph_db, mock_tqdm, mock_makedirs, mock_setup_logger, mock_load_config):
+    @pytest.mark.parametrize("files, payloads, known_keywords, expected", [
+        pytest.param(
+            ["/mock/data/file1.json", "/mock/data/file2.json"],
+            _VALID_JSON_DATA,
+            {"EARTH SCIENCE", "ATMOSPHERE", "ATMOSPHERIC TEMPERATURE", "OCEANS"},
+            {"writes": 5, "warnings": 0, "errors": 0},
+            id="valid",
+        ),
+        pytest.param(
+            ["/mock/data/file1.json", "/mock/data/file2.json", "/mock/data/file3.json"],
+            _INVALID_JSON_DATA,
+            # ATMOSPHERE gets no UUID and 10.9012/test3 is not in _DOI_UUIDS
+            {"EARTH SCIENCE"},
+            {"writes": 1, "warnings": 1, "errors": 0},
+            id="invalid_data",
+        ),
+        pytest.param(
+            ["/mock/data/file1.json", "/mock/data/missing.json"],
+            _SINGLE_TOPIC_JSON_DATA,
+            {"EARTH SCIENCE"},
+            {"writes": 1, "warnings": 0, "errors": 1},
+            id="file_not_found",
+        ),
+    ])
+    def test_process_json_files(self, process_env, files, payloads, known_keywords, expected):
         """Test processing JSON files to create relationships."""
         # Arrange
-        mock_config = AppConfig(
-            database=DatabaseConfig(
-                uri="bolt://localhost:7687",
-                user="neo4j",
-                password="password"
-            ),
-            paths=PathsConfig(
-                source_dois_directory="/mock/dois/dir",
-                dataset_metadata_directory="/mock/data/dir",
-                gcmd_sciencekeyword_directory="/mock/sciencekeyword/dir",
-                publications_metadata_directory="/mock/publication/dir",
-                pubs_of_pubs="/mock/pubs/dir",
-                log_directory="/mock/log/dir"
-            )
-        )
-        mock_load_config.return_value = mock_config
-        mock_logger = MagicMock()
-        mock_setup_logger.return_value = mock_logger
-        
-        # Setup mock driver
-        mock_driver = MagicMock()
-        mock_session = MagicMock()
-        mock_driver.session.return_value.__enter__.return_value = mock_session
-        mock_graph_db.driver.return_value.__enter__.return_value = mock_driver
+        ingestor, mock_session, mock_logger = process_env
         
-        # Mock tqdm to return input unchanged
-        mock_tqdm.side_effect = lambda x, **kwargs: x
+        # Files listed without a payload do not exist
+        contents = dict(zip(files, payloads))
         
-        # Act
-        ingestor = DatasetScienceKeywordIngestor()
+        def fake_open(path, *args, **kwargs):
+            if path not in contents:
+                raise FileNotFoundError(f"File not found: {path}")
+            return io.BytesIO(contents[path])
         
-        # Mock find_json_files
-        with patch.object(ingestor, 'find_json_files') as mock_find_json_files:
-            mock_find_json_files.return_value = ["/mock/data/file1.json", "/mock/data/file2.json"]
-            
-            # Mock generate_uuid functions
-            with patch.object(ingestor, 'generate_uuid_from_doi') as mock_generate_uuid_from_doi, \
-                 patch.object(ingestor, 'generate_uuid_from_string') as mock_generate_uuid_from_string:
-                
-                # Setup test data
-                mock_generate_uuid_from_doi.return_value = MOCK_DATASET['properties']['globalId']
-                mock_generate_uuid_from_string.return_value = MOCK_SCIENCEKEYWORD['properties']['globalId']
-                
-                # Mock open and json.load
-                json_data1 = {
-                    "DOI": {"DOI": "10.1234/test1"},
-                    "ScienceKeywords": [
-                        {
-                            "Topic": "EARTH SCIENCE",
-                            "Term": "ATMOSPHERE",
-                            "Variable_Level_1": "ATMOSPHERIC TEMPERATURE"
-                        }
-                    ]
-                }
-                json_data2 = {
-                    "DOI": {"DOI": "10.5678/test2"},
-                    "ScienceKeywords": [
-                        {
-                            "Topic": "EARTH SCIENCE",
-                            "Term": "OCEANS"
-                        }
-                    ]
-                }
-                
-                with patch('builtins.open', mock_open()) as m, \
-                     patch('json.load') as mock_json_load:
-                    mock_json_load.side_effect = [json_data1, json_data2]
-                    
-                    # Act
-                    ingestor.process_json_files("/mock/data/dir", batch_size=2)
-                    
-                    # Assert
-                    mock_find_json_files.assert_called_once()
-                    assert mock_json_load.call_count == 2
-                    # Verify execute_write was called for each relationship
-                    assert mock_session.execute_write.call_count > 0
-                    # Verify logger info calls for processing
-                    assert mock_logger.info.call_count >= 4
-                    # Check for final info logging
-                    assert any("Total relationships processed" in str(call) for call in mock_logger.info.call_args_list)
-                    assert any("Relationships created" in str(call) for call in mock_logger.info.call_args_list)
-
-    @patch('graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword.setup_logger')
-    @patch('os.makedirs')
-    @patch('graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword.tqdm')
-    @patch('graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword.GraphDatabase')
-    def test_process_json_files_with_invalid_data(self, mock_graph_db, mock_tqdm, mock_makedirs, mock_setup_logger, mock_load_config):
-        """Test processing JSON files with invalid data."""
-        # Arrange
-        mock_config = AppConfig(
-            database=DatabaseConfig(
-                uri="bolt://localhost:7687",
-                user="neo4j",
-                password="password"
-            ),
-            paths=PathsConfig(
-                source_dois_directory="/mock/dois/dir",
-                dataset_metadata_directory="/mock/data/dir",
-                gcmd_sciencekeyword_directory="/mock/sciencekeyword/dir",
-                publications_metadata_directory="/mock/publication/dir",
-                pubs_of_pubs="/mock/pubs/dir",
-                log_directory="/mock/log/dir"
-            )
+        # The ingestor is discarded after the test, so plain assignment needs no undo
+        ingestor.find_json_files = MagicMock(return_value=files)
+        ingestor.generate_uuid_from_doi = MagicMock(side_effect=_DOI_UUIDS.get)
+        ingestor.generate_uuid_from_string = MagicMock(
+            side_effect=lambda keyword: _KEYWORD_UUID if keyword in known_keywords else None
         )
-        mock_load_config.return_value = mock_config
-        mock_logger = MagicMock()
-        mock_setup_logger.return_value = mock_logger
-        
-        # Setup mock driver
-        mock_driver = MagicMock()
-        mock_session = MagicMock()
-        mock_driver.session.return_value.__enter__.return_value = mock_session
-        mock_graph_db.driver.return_value.__enter__.return_value = mock_driver
-        
-        # Mock tqdm to return input unchanged
-        mock_tqdm.side_effect = lambda x, **kwargs: x
         
         # Act
-        ingestor = DatasetScienceKeywordIngestor()
-        
-        # Mock find_json_files
-        with patch.object(ingestor, 'find_json_files') as mock_find_json_files:
-            mock_find_json_files.return_value = ["/mock/data/file1.json", "/mock/data/file2.json", "/mock/data/file3.json"]
-            
-            # Mock generate_uuid functions
-            with patch.object(ingestor, 'generate_uuid_from_doi') as mock_generate_uuid_from_doi, \
-                 patch.object(ingestor, 'generate_uuid_from_string') as mock_generate_uuid_from_string:
-                
-                # Setup test data with some invalid results
-                mock_generate_uuid_from_doi.side_effect = [MOCK_DATASET['properties']['globalId'], None, MOCK_DATASET['properties']['globalId']]
-                mock_generate_uuid_from_string.side_effect = [MOCK_SCIENCEKEYWORD['properties']['globalId'], None]
-                
-                # Mock open and json.load
-                json_data1 = {
-                    "DOI": {"DOI": "10.1234/test1"},
-                    "ScienceKeywords": [
-                        {
-                            "Topic": "EARTH SCIENCE",
-                            "Term": "ATMOSPHERE",
-                        }
-                    ]
-                }
-                json_data2 = {
-                    # Missing DOI
-                    "ScienceKeywords": [
-                        {
-                            "Topic": "EARTH SCIENCE"
-                        }
-                    ]
-                }
-                json_data3 = {
-                    "DOI": {"DOI": "10.9012/test3"},
-                    # Missing ScienceKeywords array
-                }
-                
-                with patch('builtins.open', mock_open()) as m, \
-                     patch('json.load') as mock_json_load:
-                    mock_json_load.side_effect = [json_data1, json_data2, json_data3]
-                    
-                    # Act
-                    ingestor.process_json_files("/mock/data/dir")
-                    
-                    # Assert
-                    mock_find_json_files.assert_called_once()
-                    assert mock_json_load.call_count == 3
-                    # Verify execute_write was called less times due to invalid data
-                    assert mock_session.execute_write.call_count < 3
-                    # Check for warnings
-                    assert mock_logger.warning.call_count >= 1
-
-    @patch('graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword.setup_logger')
-    @patch('os.makedirs')
-    @patch('graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword.GraphDatabase')
-    def test_process_json_files_with_exceptions(self, mock_graph_db, mock_makedirs, mock_setup_logger, mock_load_config):
-        """Test processing JSON files with exceptions."""
-        # Arrange
-        mock_config = AppConfig(
-            database=DatabaseConfig(
-                uri="bolt://localhost:7687",
-                user="neo4j",
-                password="password"
-            ),
-            paths=PathsConfig(
-                source_dois_directory="/mock/dois/dir",
-                dataset_metadata_directory="/mock/data/dir",
-                gcmd_sciencekeyword_directory="/mock/sciencekeyword/dir",
-                publications_metadata_directory="/mock/publication/dir",
-                pubs_of_pubs="/mock/pubs/dir",
-                log_directory="/mock/log/dir"
-            )
-        )
-        mock_load_config.return_value = mock_config
-        mock_logger = MagicMock()
-        mock_setup_logger.return_value = mock_logger
-        
-        # Setup mock driver
-        mock_driver = MagicMock()
-        mock_session = MagicMock()
-        mock_driver.session.return_value.__enter__.return_value = mock_session
-        mock_graph_db.driver.return_value.__enter__.return_value = mock_driver
+        with patch.object(_mod, 'open', fake_open, create=True):
+            ingestor.process_json_files("/mock/data/dir", batch_size=2)
         
-        # Act
-        ingestor = DatasetScienceKeywordIngestor()
-        
-        # Mock find_json_files
-        with patch.object(ingestor, 'find_json_files') as mock_find_json_files:
-            mock_find_json_files.return_value = ["/mock/data/file1.json", "/mock/data/file2.json"]
-            
-            # Mock open to raise exception for second file
-            def mock_open_side_effect(*args, **kwargs):
-                if args[0] == "/mock/data/file1.json":
-                    return mock_open().return_value
-                else:
-                    raise FileNotFoundError(f"File not found: {args[0]}")
-            
-            with patch('builtins.open', side_effect=mock_open_side_effect), \
-                 patch('json.load') as mock_json_load, \
-                 patch('graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword.tqdm', lambda x, **kwargs: x):
-                
-                # Setup json.load to return valid data for the first file
-                mock_json_load.return_value = {
-                    "DOI": {"DOI": "10.1234/test1"},
-                    "ScienceKeywords": [
-                        {
-                            "Topic": "EARTH SCIENCE"
-                        }
-                    ]
-                }
-                
-                # Setup UUID generation to succeed
-                with patch.object(ingestor, 'generate_uuid_from_doi') as mock_generate_uuid_from_doi, \
-                     patch.object(ingestor, 'generate_uuid_from_string') as mock_generate_uuid_from_string:
-                    
-                    mock_generate_uuid_from_doi.return_value = MOCK_DATASET['properties']['globalId']
-                    mock_generate_uuid_from_string.return_value = MOCK_SCIENCEKEYWORD['properties']['globalId']
-                    
-                    # Act
-                    ingestor.process_json_files("/mock/data/dir")
-                    
-                    # Assert
-                    mock_find_json_files.assert_called_once()
-                    assert mock_json_load.call_count == 1  # Only one file successfully loaded
-                    # Error should be logged for the failed file
-                    assert mock_logger.error.call_count >= 1
-                    # Check for error about failed files
-                    assert any("Failed to process file" in str(call) for call in mock_logger.error.call_args_list)
+        # Assert
+        ingestor.find_json_files.assert_called_once_with("/mock/data/dir")
+        assert mock_session.execute_write.call_count == expected["writes"]
+        assert mock_logger.warning.call_count == expected["warnings"]
+        assert mock_logger.error.call_count == expected["errors"]
+        if expected["errors"]:
+            assert "Failed to process file" in mock_logger.error.call_args.args[0]
+        mock_logger.info.assert_any_call(f"Total relationships processed: {expected['writes']}")
+        mock_logger.info.assert_any_call(f"Relationships created: {expected['writes']}")
 
+    @pytest.mark.parametrize("via_main", [False, True], ids=["run", "main"])
     @patch('graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword.DatasetScienceKeywordIngestor.process_json_files')
-    @patch('graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword.setup_logger')
-    @patch('os.makedirs')
-    def test_run(self, mock_makedirs, mock_setup_logger, mock_load_config, mock_process_json_files):
-        """Test the run method."""
-        # Arrange
-        mock_config = AppConfig(
-            database=DatabaseConfig(
-                uri="bolt://localhost:7687",
-                user="neo4j",
-                password="password"
-            ),
-            paths=PathsConfig(
-                source_dois_directory="/mock/dois/dir",
-                dataset_metadata_directory="/mock/data/dir",
-                gcmd_sciencekeyword_directory="/mock/sciencekeyword/dir",
-                publications_metadata_directory="/mock/publication/dir",
-                pubs_of_pubs="/mock/pubs/dir",
-                log_directory="/mock/log/dir"
-            )
-        )
-        mock_load_config.return_value = mock_config
-        mock_logger = MagicMock()
-        mock_setup_logger.return_value = mock_logger
-        
+    def test_run(self, mock_process_json_files, mock_config, via_main):
+        """Test the run method, directly and through main()."""
         # Act
-        ingestor = DatasetScienceKeywordIngestor()
-        ingestor.run()
+        if via_main:
+            main()
+        else:
+            DatasetScienceKeywordIngestor().run()
         
         # Assert
         mock_process_json_files.assert_called_once_with(mock_config.paths.dataset_metadata_directory)
-
-    @patch('graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword.setup_logger')
-    def test_main_function(self, mock_setup_logger, mock_load_config):
-        """Test the main function."""
-        # Arrange
-        mock_config = AppConfig(
-            database=DatabaseConfig(
-                uri="bolt://localhost:7687",
-                user="neo4j",
-                password="password"
-            ),
-            paths=PathsConfig(
-                source_dois_directory="/mock/dois/dir",
-                dataset_metadata_directory="/mock/data/dir",
-                gcmd_sciencekeyword_directory="/mock/sciencekeyword/dir",
-                publications_metadata_directory="/mock/publication/dir",
-                pubs_of_pubs="/mock/pubs/dir",
-                log_directory="/mock/log/dir"
-            )
-        )
-        mock_load_config.return_value = mock_config
-        mock_logger = MagicMock()
-        mock_setup_logger.return_value = mock_logger
-        
-        with patch('graph_ingest.ingest_scripts.ingest_edge_dataset_sciencekeyword.DatasetScienceKeywordIngestor') as mock_ingestor_class:
-            mock_ingestor = MagicMock()
-            mock_ingestor_class.return_value = mock_ingestor
-            mock_ingestor.logger = mock_logger
-            
-            # Act
-            main()
-            
-            # Assert
-            mock_ingestor_class.assert_called_once()
-            mock_ingestor.run.assert_called_once()
-
-    def setup_mock_config(self):
-        """Create a mock configuration for testing."""
-        return AppConfig(
-            database=DatabaseConfig(
-                uri="bolt://localhost:7687",
-                user="neo4j",
-                password="password"
-            ),
-            paths=PathsConfig(
-                source_dois_directory="/mock/dois/dir",
-                dataset_metadata_directory="/mock/data/dir",
-                gcmd_sciencekeyword_directory="/mock/sciencekeyword/dir",
-                publications_metadata_directory="/mock/publication/dir",
-                pubs_of_pubs="/mock/pubs/dir",
-                log_directory="/mock/log/dir"
-            )
-        ) 
\ No newline at end of file
@@ -15,12 +15,45 @@ interacts with the Neo4j Graph Data Science library to compute and store node em
 """
 
 import logging
-from unittest.mock import patch, MagicMock, call, ANY
+from contextlib import ExitStack
+from dataclasses import replace
+from unittest.mock import patch, MagicMock, call, create_autospec
 
 import pytest
+from neo4j import Driver, Session
+from neo4j.exceptions import ClientError
 
+from graph_ingest.common.config_reader import ProjectionConfig
 from graph_ingest.ingest_scripts.ingest_compute_fastrp import FastRPProcessor, main
 
+pytestmark = pytest.mark.xdist_group("fastrp")
+
+
+@pytest.fixture(scope="module")
+def base_processor(mock_config):
+    """FastRPProcessor built once for the module with its config, logger and driver patched.
+
+    Yields:
+        Tuple of (processor, mock_logger, mock_driver)
+    """
+    mock_logger = MagicMock()
+    # Spec'd against the real driver so a misspelt method fails instead of passing silently
+    mock_driver = create_autospec(Driver, instance=True)
+    with ExitStack() as stack:
+        stack.enter_context(patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.get_driver', autospec=True, return_value=mock_driver))
+        stack.enter_context(patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.load_config', return_value=mock_config))
+        stack.enter_context(patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.setup_logger', return_value=mock_logger))
+        yield FastRPProcessor(), mock_logger, mock_driver
+
+
+@pytest.fixture
+def processor(base_processor):
+    """The shared processor with its logger and driver calls from earlier tests cleared."""
+    _, mock_logger, mock_driver = base_processor
+    mock_logger.reset_mock()
+    mock_driver.reset_mock()
+    return base_processor
+
 
 class TestFastRPProcessor:
     """Tests for the FastRPProcessor class."""
@@ -49,15 +82,9 @@ class TestFastRPProcessor:
         assert processor.logger == mock_setup_logger.return_value
         assert processor.driver == mock_driver
 
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.get_driver')
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.setup_logger')
-    def test_drop_existing_projection_when_exists(self, mock_setup_logger, mock_load_config, mock_get_driver):
+    def test_drop_existing_projection_when_exists(self, processor):
         """Test dropping an existing graph projection when it exists."""
-        # Configure the mocks
-        mock_load_config.return_value = {"test_config": "value"}
-        mock_logger = MagicMock()
-        mock_setup_logger.return_value = mock_logger
+        processor, mock_logger, _ = processor
         
         # Create a mock transaction
         mock_tx = MagicMock()
@@ -65,28 +92,21 @@ class TestFastRPProcessor:
         mock_result["exists"] = True
         mock_tx.run.return_value.single.return_value = mock_result
         
-        # Create the processor
-        processor = FastRPProcessor()
-        
         # Test dropping the existing projection
         processor._drop_existing_projection(mock_tx)
         
         # Verify that tx.run was called correctly
-        assert any("CALL gds.graph.exists('graphEmbedding') YIELD exists RETURN exists" in str(call) for call in mock_tx.run.call_args_list)
-        assert any("CALL gds.graph.drop('graphEmbedding') YIELD graphName" in str(call) for call in mock_tx.run.call_args_list)
+        assert mock_tx.run.call_args_list == [
+            call("CALL gds.graph.exists('graphEmbedding') YIELD exists RETURN exists"),
+            call("CALL gds.graph.drop('graphEmbedding') YIELD graphName"),
+        ]
         
         # Verify logging
         mock_logger.info.assert_any_call("Existing graph projection 'graphEmbedding' dropped.")
 
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.get_driver')
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.setup_logger')
-    def test_drop_existing_projection_when_not_exists(self, mock_setup_logger, mock_load_config, mock_get_driver):
+    def test_drop_existing_projection_when_not_exists(self, processor):
         """Test dropping an existing graph projection when it doesn't exist."""
-        # Configure the mocks
-        mock_load_config.return_value = {"test_config": "value"}
-        mock_logger = MagicMock()
-        mock_setup_logger.return_value = mock_logger
+        processor, mock_logger, _ = processor
 
         # Create a mock transaction with no existing graph projection
         mock_tx = MagicMock()
@@ -95,9 +115,6 @@ class TestFastRPProcessor:
         mock_result = MagicMock()
         mock_result.__getitem__.return_value = False  # This is the key part - result["exists"] should be False
         mock_tx.run.return_value.single.return_value = mock_result
-        
-        # Create the processor
-        processor = FastRPProcessor()
 
         # Test dropping the existing projection
         processor._drop_existing_projection(mock_tx)
@@ -112,252 +129,100 @@ class TestFastRPProcessor:
         # Verify that some logging happened
         assert mock_logger.info.call_count > 0
 
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.get_driver')
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.setup_logger')
-    def test_create_graph_projection_success(self, mock_setup_logger, mock_load_config, mock_get_driver):
-        """Test creating a graph projection successfully."""
-        # Configure the mocks
-        mock_load_config.return_value = {"test_config": "value"}
-        mock_logger = MagicMock()
-        mock_setup_logger.return_value = mock_logger
-        
-        # Create a mock transaction
+    @pytest.mark.parametrize("succeeds", [True, False], ids=["success", "failure"])
+    @pytest.mark.parametrize("method_name, query_fragment, record, success_msg, failure_msg", [
+        (
+            "_create_graph_projection",
+            "CALL gds.graph.project(",
+            {"graphName": "graphEmbedding", "nodeCount": 100, "relationshipCount": 200},
+            "Graph projection created: graphEmbedding with 100 nodes and 200 relationships.",
+            "Failed to create graph projection.",
+        ),
+        (
+            "_run_fastrp",
+            "CALL gds.fastRP.write('graphEmbedding'",
+            {"nodePropertiesWritten": 100},
+            "FastRP embeddings written to 100 nodes.",
+            "Failed to run FastRP or write embeddings.",
+        ),
+        (
+            "_export_embeddings_to_csv",
+            "CALL gds.beta.graph.export.csv('graphEmbedding'",
+            {"exportName": "fastrp_embeddings", "nodeCount": 100},
+            "FastRP embeddings exported to CSV 'fastrp_embeddings' for 100 nodes.",
+            "Failed to export FastRP embeddings to CSV.",
+        ),
+        (
+            "_drop_graph_projection",
+            "CALL gds.graph.drop('graphEmbedding') YIELD graphName",
+            {"graphName": "graphEmbedding"},
+            "Graph projection 'graphEmbedding' dropped.",
+            "Failed to drop the graph projection.",
+        ),
+        (
+            "_get_embedding_stats",
+            "WHERE n.fastrp_embedding_with_labels IS NOT NULL",
+            {"embedding_nodes": 100},
+            "Total nodes with FastRP embeddings: 100",
+            "Failed to retrieve FastRP embedding stats.",
+        ),
+    ], ids=["create_projection", "run_fastrp", "export_csv", "drop_projection", "embedding_stats"])
+    def test_single_query_steps(self, processor, method_name, query_fragment, record, success_msg, failure_msg, succeeds):
+        """Test each single-query step logs its result, or an error when the query returns nothing."""
+        processor, mock_logger, _ = processor
+        
+        # Create a mock transaction returning the record, or nothing on failure
         mock_tx = MagicMock()
-        mock_result = MagicMock()
-        mock_result["graphName"] = "graphEmbedding"
-        mock_result["nodeCount"] = 100
-        mock_result["relationshipCount"] = 200
-        mock_tx.run.return_value.single.return_value = mock_result
-        
-        # Create the processor
-        processor = FastRPProcessor()
+        mock_tx.run.return_value.single.return_value = record if succeeds else None
         
-        # Test creating the graph projection
-        processor._create_graph_projection(mock_tx)
+        # Run the step
+        getattr(processor, method_name)(mock_tx)
         
-        # Verify that tx.run was called
+        # Verify the query ran once and the outcome was logged
         mock_tx.run.assert_called_once()
-        
-        # Verify logging - use ANY to match the generated message regardless of the mock object values
-        mock_logger.info.assert_called_with(ANY)
+        assert query_fragment in mock_tx.run.call_args.args[0]
+        if succeeds:
+            mock_logger.info.assert_called_with(success_msg)
+        else:
+            mock_logger.error.assert_called_with(failure_msg)
 
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.get_driver')
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.setup_logger')
-    def test_create_graph_projection_failure(self, mock_setup_logger, mock_load_config, mock_get_driver):
-        """Test creating a graph projection with failure."""
-        # Configure the mocks
-        mock_load_config.return_value = {"test_config": "value"}
-        mock_logger = MagicMock()
-        mock_setup_logger.return_value = mock_logger
-        
-        # Create a mock transaction
+    def test_create_graph_projection_uses_config_labels(self, processor, mock_config, monkeypatch):
+        """Test that the graph projection is limited to the configured labels and types."""
+        processor, _, _ = processor
+        projection = ProjectionConfig(node_labels=["Dataset", "Publication"], rel_types=["CITES"])
+        monkeypatch.setattr(processor, "config", replace(mock_config, projection=projection))
         mock_tx = MagicMock()
-        mock_tx.run.return_value.single.return_value = None
-        
-        # Create the processor
-        processor = FastRPProcessor()
         
-        # Test creating the graph projection
+        # Create the projection
         processor._create_graph_projection(mock_tx)
         
-        # Verify that tx.run was called correctly
-        mock_tx.run.assert_called_once()
-        
-        # Verify logging
-        mock_logger.error.assert_called_with("Failed to create graph projection.")
-
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.get_driver')
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.setup_logger')
-    def test_run_fastrp_success(self, mock_setup_logger, mock_load_config, mock_get_driver):
-        """Test running FastRP algorithm successfully."""
-        # Configure the mocks
-        mock_load_config.return_value = {"test_config": "value"}
-        mock_logger = MagicMock()
-        mock_setup_logger.return_value = mock_logger
-        
-        # Create a mock transaction
-        mock_tx = MagicMock()
-        mock_result = MagicMock()
-        mock_result["nodePropertiesWritten"] = 100
-        mock_tx.run.return_value.single.return_value = mock_result
-        
-        # Create the processor
-        processor = FastRPProcessor()
-        
-        # Test running FastRP
-        processor._run_fastrp(mock_tx)
-        
-        # Verify that tx.run was called correctly
-        mock_tx.run.assert_called_once()
-        
-        # Verify logging using ANY for flexible assertion
-        mock_logger.info.assert_called_with(ANY)
-
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.get_driver')
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.setup_logger')
-    def test_run_fastrp_failure(self, mock_setup_logger, mock_load_config, mock_get_driver):
-        """Test running FastRP algorithm with failure."""
-        # Configure the mocks
-        mock_load_config.return_value = {"test_config": "value"}
-        mock_logger = MagicMock()
-        mock_setup_logger.return_value = mock_logger
-        
-        # Create a mock transaction
-        mock_tx = MagicMock()
-        mock_tx.run.return_value.single.return_value = None
-        
-        # Create the processor
-        processor = FastRPProcessor()
-        
-        # Test running FastRP
-        processor._run_fastrp(mock_tx)
-        
-        # Verify that tx.run was called correctly
-        mock_tx.run.assert_called_once()
-        
-        # Verify logging
-        mock_logger.error.assert_called_with("Failed to run FastRP or write embeddings.")
-
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.get_driver')
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.setup_logger')
-    def test_drop_graph_projection_success(self, mock_setup_logger, mock_load_config, mock_get_driver):
-        """Test dropping a graph projection successfully."""
-        # Configure the mocks
-        mock_load_config.return_value = {"test_config": "value"}
-        mock_logger = MagicMock()
-        mock_setup_logger.return_value = mock_logger
-        
-        # Create a mock transaction
-        mock_tx = MagicMock()
-        mock_result = MagicMock()
-        mock_result["graphName"] = "graphEmbedding"
-        mock_tx.run.return_value.single.return_value = mock_result
-        
-        # Create the processor
-        processor = FastRPProcessor()
-        
-        # Test dropping the graph projection
-        processor._drop_graph_projection(mock_tx)
-        
-        # Verify that tx.run was called correctly
-        mock_tx.run.assert_called_with("CALL gds.graph.drop('graphEmbedding') YIELD graphName")
-        
-        # Verify logging using ANY to match regardless of mock object values
-        mock_logger.info.assert_called_with(ANY)
+        # Verify the configured labels and types were passed as query parameters
+        assert mock_tx.run.call_args.kwargs == {
+            "node_labels": ["Dataset", "Publication"],
+            "rel_types": ["CITES"],
+        }
 
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.get_driver')
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.setup_logger')
-    def test_drop_graph_projection_failure(self, mock_setup_logger, mock_load_config, mock_get_driver):
-        """Test dropping a graph projection with failure."""
-        # Configure the mocks
-        mock_load_config.return_value = {"test_config": "value"}
-        mock_logger = MagicMock()
-        mock_setup_logger.return_value = mock_logger
-        
-        # Create a mock transaction
-        mock_tx = MagicMock()
-        mock_tx.run.return_value.single.return_value = None
-        
-        # Create the processor
-        processor = FastRPProcessor()
-        
-        # Test dropping the graph projection
-        processor._drop_graph_projection(mock_tx)
-        
-        # Verify that tx.run was called correctly
-        mock_tx.run.assert_called_with("CALL gds.graph.drop('graphEmbedding') YIELD graphName")
-        
-        # Verify logging
-        mock_logger.error.assert_called_with("Failed to drop the graph projection.")
-
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.get_driver')
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.setup_logger')
-    def test_get_embedding_stats_success(self, mock_setup_logger, mock_load_config, mock_get_driver):
-        """Test getting FastRP statistics successfully."""
-        # Configure the mocks
-        mock_load_config.return_value = {"test_config": "value"}
-        mock_logger = MagicMock()
-        mock_setup_logger.return_value = mock_logger
-        
-        # Create a mock transaction
-        mock_tx = MagicMock()
-        mock_result = MagicMock()
-        mock_result["embedding_nodes"] = 100
-        mock_tx.run.return_value.single.return_value = mock_result
-        
-        # Create the processor
-        processor = FastRPProcessor()
-        
-        # Test getting FastRP stats
-        processor._get_embedding_stats(mock_tx)
-        
-        # Verify that tx.run was called
-        mock_tx.run.assert_called_once()
-        
-        # Verify logging with ANY to match regardless of the mock object values
-        mock_logger.info.assert_called_with(ANY)
-
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.get_driver')
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.setup_logger')
-    def test_get_embedding_stats_failure(self, mock_setup_logger, mock_load_config, mock_get_driver):
-        """Test getting FastRP statistics with failure."""
-        # Configure the mocks
-        mock_load_config.return_value = {"test_config": "value"}
-        mock_logger = MagicMock()
-        mock_setup_logger.return_value = mock_logger
-        
-        # Create a mock transaction
-        mock_tx = MagicMock()
-        mock_tx.run.return_value.single.return_value = None
-        
-        # Create the processor
-        processor = FastRPProcessor()
-        
-        # Test getting FastRP stats
-        processor._get_embedding_stats(mock_tx)
-        
-        # Verify that tx.run was called correctly
-        mock_tx.run.assert_called_once()
-        
-        # Verify logging
-        mock_logger.error.assert_called_with("Failed to retrieve FastRP embedding stats.")
-
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.get_driver')
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.setup_logger')
-    def test_run_fastrp_embeddings_workflow(self, mock_setup_logger, mock_load_config, mock_get_driver):
-        """Test the complete FastRP embeddings workflow."""
-        # Configure the mocks
-        mock_load_config.return_value = {"test_config": "value"}
-        mock_logger = MagicMock()
-        mock_setup_logger.return_value = mock_logger
-        
-        # Create a mock session and driver
-        mock_session = MagicMock()
-        mock_driver = MagicMock()
-        mock_driver.session.return_value = mock_session
+    @pytest.mark.parametrize("export_csv", [False, True], ids=["no_export", "export"])
+    def test_run_fastrp_embeddings_workflow(self, processor, mock_config, monkeypatch, export_csv):
+        """Test the complete FastRP embeddings workflow, with and without the CSV export."""
+        processor, mock_logger, mock_driver = processor
+        projection = ProjectionConfig(export_csv=export_csv)
+        monkeypatch.setattr(processor, "config", replace(mock_config, projection=projection))
+        
+        # Create a mock session for the driver to hand out
+        mock_session = create_autospec(Session, instance=True)
         mock_driver.session.return_value.__enter__.return_value = mock_session
-        mock_get_driver.return_value = mock_driver
-        
-        # Create the processor
-        processor = FastRPProcessor()
         
         # Test the complete workflow
         processor.run_fastrp_embeddings()
         
         # Verify that the session methods were called in the correct order
+        export_steps = [call(processor._export_embeddings_to_csv)] if export_csv else []
         assert mock_session.execute_write.call_args_list == [
             call(processor._drop_existing_projection),
             call(processor._create_graph_projection),
             call(processor._run_fastrp),
+            *export_steps,
             call(processor._drop_graph_projection)
         ]
         assert mock_session.execute_read.call_args_list == [
@@ -374,21 +239,34 @@ class TestFastRPProcessor:
         ]
         for log in expected_logs:
             mock_logger.info.assert_any_call(log)
+        export_logged = call("Exporting FastRP embeddings to CSV...") in mock_logger.info.call_args_list
+        assert export_logged is export_csv
 
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.get_driver')
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.load_config')
-    @patch('graph_ingest.ingest_scripts.ingest_compute_fastrp.setup_logger')
-    def test_close(self, mock_setup_logger, mock_load_config, mock_get_driver):
-        """Test closing the database connection."""
-        # Configure the mocks
-        mock_load_config.return_value = {"test_config": "value"}
-        mock_logger = MagicMock()
-        mock_setup_logger.return_value = mock_logger
-        mock_driver = MagicMock()
-        mock_get_driver.return_value = mock_driver
+    def test_run_fastrp_embeddings_export_failure(self, processor, mock_config, monkeypatch):
+        """Test that a failed CSV export is logged and the projection is still dropped."""
+        processor, mock_logger, mock_driver = processor
+        monkeypatch.setattr(processor, "config", replace(mock_config, projection=ProjectionConfig(export_csv=True)))
         
-        # Create the processor
-        processor = FastRPProcessor()
+        # Make only the export step fail, as it does when the server has no export location
+        mock_session = create_autospec(Session, instance=True)
+        mock_driver.session.return_value.__enter__.return_value = mock_session
+        def execute_write(step):
+            if step == processor._export_embeddings_to_csv:
+                raise ClientError("gds.export.location is not set")
+        mock_session.execute_write.side_effect = execute_write
+        
+        # Run the workflow
+        processor.run_fastrp_embeddings()
+        
+        # Verify the error was logged and the workflow carried on to the final drop
+        mock_logger.error.assert_called_once_with(
+            "Failed to export FastRP embeddings to CSV: gds.export.location is not set"
+        )
+        assert mock_session.execute_write.call_args_list[-1] == call(processor._drop_graph_projection)
+
+    def test_close(self, processor):
+        """Test closing the database connection."""
+        processor, mock_logger, mock_driver = processor
         
         # Test closing the connection
         processor.close()
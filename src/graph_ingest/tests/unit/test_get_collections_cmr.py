@@ -1,59 +1,65 @@
 import pytest
+import requests
 from unittest.mock import patch, mock_open, MagicMock
+import copy
 import json
 import os
+import hashlib
+import pandas as pd
+from dataclasses import replace
 from graph_ingest.common.config_reader import AppConfig, DatabaseConfig, PathsConfig
+from graph_ingest.common.core import find_json_files
 from graph_ingest.tests.unit.base_test import BaseIngestorTest
 
-# Mock os.makedirs at the module level to prevent filesystem operations during import
-makedirs_patcher = patch('os.makedirs')
-makedirs_mock = makedirs_patcher.start()
+from graph_ingest.ingest_scripts import get_collections_cmr as cmr_mod
+from graph_ingest.ingest_scripts.get_collections_cmr import main, MetadataFetcher
 
-# Mock the logger.setup at the module level to prevent filesystem operations during import
-logger_patcher = patch('graph_ingest.common.logger_setup.setup_logger')
-logger_mock = logger_patcher.start()
+# CMR search response for a single monthly dataset. MetadataFetcher adds keys to the
+# returned UMM, so tests hand out deep copies.
+_CMR_SUCCESS_PAYLOAD = {
+    "items": [
+        {
+            "meta": {
+                "concept-id": "C1234567-TEST"
+            },
+            "umm": {
+                "EntryTitle": "Test Dataset Monthly",
+                "Abstract": "This is a test dataset",
+                "DataCenters": [
+                    {
+                        "ShortName": "TEST_CENTER"
+                    }
+                ]
+            }
+        }
+    ]
+}
 
-# Import the functions directly
-from graph_ingest.ingest_scripts.get_collections_cmr import main, MetadataFetcher
 
-def tearDownModule():
-    """Clean up the module-level patchers"""
-    makedirs_patcher.stop()
-    logger_patcher.stop()
+@pytest.fixture(autouse=True, scope="module")
+def _patch_fs():
+    """Keep MetadataFetcher off the real filesystem and log directory for this module.
+
+    Module-scoped so the patches are undone before other modules, which need the real os.makedirs, run.
+    """
+    with patch('os.makedirs'), patch('graph_ingest.ingest_scripts.get_collections_cmr.setup_logger'):
+        yield
 
 class TestMetadataFetcher(BaseIngestorTest):
     """Tests for the MetadataFetcher class."""
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     @patch('os.makedirs')
-    @patch('builtins.open', new_callable=MagicMock)
-    @patch('pandas.read_csv')
+    @patch('builtins.open', new_callable=mock_open)
     @patch('graph_ingest.common.logger_setup.setup_logger')
-    def test_process_doi_success(self, mock_logger_setup, mock_read_csv, mock_open, mock_makedirs, mock_get):
+    def test_process_doi_success(self, mock_logger_setup, mock_open, mock_makedirs, mock_get):
         """
         Test that the process_doi method behaves correctly when the metadata fetch is successful.
         """
         # Arrange
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "items": [
-                {
-                    "meta": {
-                        "concept-id": "C1234567-TEST"
-                    },
-                    "umm": {
-                        "EntryTitle": "Test Dataset Monthly",
-                        "Abstract": "This is a test dataset",
-                        "DataCenters": [
-                            {
-                                "ShortName": "TEST_CENTER"
-                            }
-                        ]
-                    }
-                }
-            ]
-        }
+        mock_response.json.return_value = copy.deepcopy(_CMR_SUCCESS_PAYLOAD)
         mock_get.return_value = mock_response
 
         # Create fetcher instance with mock config
@@ -65,17 +71,20 @@ class TestMetadataFetcher(BaseIngestorTest):
 
         # Assert
         assert result == (doi, True, True, "monthly", False)
-        mock_get.assert_called_once_with('https://cmr.earthdata.nasa.gov/search/collections.umm_json?doi=10.5067%2FIAGYM8QHCD5')
+        mock_get.assert_called_once_with('https://cmr.earthdata.nasa.gov/search/collections.umm_json', params={"doi": doi}, timeout=(5, 30))
         
         expected_path = os.path.join(self.setup_mock_config().paths.dataset_metadata_directory, "TEST_CENTER", "10.5067_IAGYM8QHCD5.json")
-        mock_open.assert_called_once_with(expected_path, "w")
+        mock_open.assert_called_once_with(expected_path, "wb")
+        written = mock_open.return_value.__enter__.return_value.write.call_args.args[0]
+        assert json.loads(written) == {
+            **_CMR_SUCCESS_PAYLOAD["items"][0]["umm"], "CMR_ID": "C1234567-TEST", "Frequency": "monthly"
+        }
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     @patch('os.makedirs')
-    @patch('builtins.open', new_callable=MagicMock)
-    @patch('pandas.read_csv')
+    @patch('builtins.open', new_callable=mock_open)
     @patch('graph_ingest.common.logger_setup.setup_logger')
-    def test_process_doi_api_failure(self, mock_logger_setup, mock_read_csv, mock_open, mock_makedirs, mock_get):
+    def test_process_doi_api_failure(self, mock_logger_setup, mock_open, mock_makedirs, mock_get):
         """
         Test that the process_doi method returns appropriate values when the API request fails.
         """
@@ -95,15 +104,14 @@ class TestMetadataFetcher(BaseIngestorTest):
 
         # Assert
         assert result == (doi, False, False, "Unknown", False)
-        mock_get.assert_called_once_with('https://cmr.earthdata.nasa.gov/search/collections.umm_json?doi=10.5067%2FIAGYM8QHCD5')
+        mock_get.assert_called_once_with('https://cmr.earthdata.nasa.gov/search/collections.umm_json', params={"doi": doi}, timeout=(5, 30))
         mock_open.assert_not_called()
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     @patch('os.makedirs')
-    @patch('builtins.open', new_callable=MagicMock)
-    @patch('pandas.read_csv')
+    @patch('builtins.open', new_callable=mock_open)
     @patch('graph_ingest.common.logger_setup.setup_logger')
-    def test_process_doi_exception_handling(self, mock_logger_setup, mock_read_csv, mock_open, mock_makedirs, mock_get):
+    def test_process_doi_exception_handling(self, mock_logger_setup, mock_open, mock_makedirs, mock_get):
         """
         Test that the process_doi method properly handles exceptions.
         """
@@ -119,10 +127,276 @@ class TestMetadataFetcher(BaseIngestorTest):
 
         # Assert
         assert result == (doi, False, False, "Unknown", False)
-        mock_get.assert_called_once_with('https://cmr.earthdata.nasa.gov/search/collections.umm_json?doi=10.5067%2FIAGYM8QHCD5')
+        mock_get.assert_called_once_with('https://cmr.earthdata.nasa.gov/search/collections.umm_json', params={"doi": doi}, timeout=(5, 30))
         mock_open.assert_not_called()
         mock_makedirs.assert_not_called()
 
+    @patch('requests.Session.post')
+    @patch('os.makedirs')
+    @patch('builtins.open', new_callable=mock_open)
+    def test_process_dois_bulk(self, mock_open, mock_makedirs, mock_post):
+        """
+        Test that process_dois fetches several DOIs with one CMR request and reports misses as failures.
+        """
+        # Arrange
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "items": [
+                {
+                    "meta": {"concept-id": "C1-TEST"},
+                    "umm": {
+                        "DOI": {"DOI": "10.5067/AAA"},
+                        "EntryTitle": "First Dataset Daily",
+                        "DataCenters": [{"ShortName": "CENTER_A"}]
+                    }
+                },
+                {
+                    "meta": {"concept-id": "C2-TEST"},
+                    "umm": {
+                        # CMR may return the DOI in a different case
+                        "DOI": {"DOI": "10.5067/bbb"},
+                        "EntryTitle": "Second Dataset",
+                        "DataCenters": [{"ShortName": "CENTER_B"}]
+                    }
+                }
+            ]
+        }
+        mock_post.return_value = mock_response
+
+        fetcher = MetadataFetcher(self.setup_mock_config())
+
+        # Act
+        results = fetcher.process_dois(["10.5067/AAA", "10.5067/BBB", "10.5067/MISSING"])
+
+        # Assert
+        assert results == [
+            ("10.5067/AAA", True, True, "daily", False),
+            ("10.5067/BBB", True, True, "Unknown", False),
+            ("10.5067/MISSING", False, False, "Unknown", False),
+        ]
+        mock_post.assert_called_once()
+        assert mock_post.call_args.args == ('https://cmr.earthdata.nasa.gov/search/collections.umm_json',)
+        assert mock_post.call_args.kwargs["data"][:3] == [
+            ("doi[]", "10.5067/AAA"), ("doi[]", "10.5067/BBB"), ("doi[]", "10.5067/MISSING")
+        ]
+        base_dir = self.setup_mock_config().paths.dataset_metadata_directory
+        assert [c.args for c in mock_open.call_args_list] == [
+            (os.path.join(base_dir, "CENTER_A", "10.5067_AAA.json"), "wb"),
+            (os.path.join(base_dir, "CENTER_B", "10.5067_BBB.json"), "wb"),
+        ]
+
+    @patch('requests.get')
+    @patch('builtins.open', new_callable=mock_open)
+    def test_process_doi_uses_session(self, mock_open, mock_requests_get):
+        """
+        Test that process_doi goes through the fetcher's pooled, retrying session rather than requests.get.
+        """
+        # Arrange
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.side_effect = lambda: copy.deepcopy(_CMR_SUCCESS_PAYLOAD)
+        fetcher = MetadataFetcher(self.setup_mock_config())
+
+        # Act
+        with patch.object(fetcher._session, 'get', return_value=mock_response) as mock_session_get:
+            fetcher.process_doi("10.5067/FIRST")
+            fetcher.process_doi("10.5067/SECOND")
+
+        # Assert
+        assert mock_session_get.call_count == 2
+        mock_requests_get.assert_not_called()
+        assert fetcher._session.get_adapter(cmr_mod.CMR_COLLECTIONS_URL).max_retries.total == 3
+
+    @pytest.mark.parametrize("use_orjson", [
+        pytest.param(True, id="orjson", marks=pytest.mark.skipif(cmr_mod.orjson is None, reason="orjson not installed")),
+        pytest.param(False, id="stdlib"),
+    ])
+    def test_save_metadata_serializers(self, use_orjson, tmp_path):
+        """
+        Test that save_metadata writes the same JSON with or without orjson and returns its digest.
+        """
+        # Arrange
+        config = self.setup_mock_config()
+        config = replace(config, paths=replace(config.paths, dataset_metadata_directory=str(tmp_path)))
+        (tmp_path / "TEST_CENTER").mkdir()
+        umm = {"EntryTitle": "Test Dataset Monthly", "CMR_ID": "C1234567-TEST", "Frequency": "monthly"}
+        fetcher = MetadataFetcher(config)
+
+        # Act
+        with patch.object(cmr_mod, 'orjson', cmr_mod.orjson if use_orjson else None):
+            digest = fetcher.save_metadata("10.5067/IAGYM8QHCD5", umm, "TEST_CENTER")
+
+        # Assert
+        written = (tmp_path / "TEST_CENTER" / "10.5067_IAGYM8QHCD5.json").read_bytes()
+        assert json.loads(written) == umm
+        assert digest == hashlib.sha256(written).hexdigest()
+
+    @patch('requests.Session.get')
+    def test_process_doi_uses_cache(self, mock_get, tmp_path):
+        """
+        Test that a DOI saved by an earlier run is served from the cache index without a CMR request.
+        """
+        # Arrange
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = copy.deepcopy(_CMR_SUCCESS_PAYLOAD)
+        mock_get.return_value = mock_response
+        metadata_dir = tmp_path / "collection_metadata"
+        config = self.setup_mock_config()
+        config = replace(config, paths=replace(config.paths, dataset_metadata_directory=str(metadata_dir)))
+        (metadata_dir / "TEST_CENTER").mkdir(parents=True)
+        doi = "10.5067/IAGYM8QHCD5"
+
+        first_run = MetadataFetcher(config)
+        first_run.process_doi(doi)
+        first_run.save_cache_index()
+
+        # Act
+        second_run = MetadataFetcher(config)
+        cached = second_run.process_doi(doi)
+        saved_file = metadata_dir / "TEST_CENTER" / "10.5067_IAGYM8QHCD5.json"
+        saved_file.write_text("{}")
+        refetched = second_run.process_doi(doi)
+
+        # Assert
+        assert cached == (doi, True, True, "monthly", False)
+        assert refetched == cached
+        # Fetched by the first run, then again only once the saved file no longer matched
+        assert mock_get.call_count == 2
+        assert json.loads(saved_file.read_text())["CMR_ID"] == "C1234567-TEST"
+
+    @patch('requests.Session.get')
+    def test_cache_index_outside_metadata_directory(self, mock_get, tmp_path):
+        """
+        Test that the cache index is not among the JSON files ingestors find in the metadata directory.
+        """
+        # Arrange
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = copy.deepcopy(_CMR_SUCCESS_PAYLOAD)
+        mock_get.return_value = mock_response
+        metadata_dir = tmp_path / "collection_metadata"
+        config = self.setup_mock_config()
+        config = replace(config, paths=replace(config.paths, dataset_metadata_directory=str(metadata_dir)))
+        (metadata_dir / "TEST_CENTER").mkdir(parents=True)
+        fetcher = MetadataFetcher(config)
+
+        # Act
+        fetcher.process_doi("10.5067/IAGYM8QHCD5")
+        fetcher.save_cache_index()
+
+        # Assert
+        assert os.path.exists(fetcher.cache_index_path)
+        assert list(find_json_files(str(metadata_dir))) == [
+            str(metadata_dir / "TEST_CENTER" / "10.5067_IAGYM8QHCD5.json")
+        ]
+
+    @patch('graph_ingest.ingest_scripts.get_collections_cmr.BULK_CHUNK_SIZE', 1)
+    @patch('requests.Session')
+    @patch('os.makedirs')
+    @patch('builtins.open', new_callable=mock_open)
+    def test_run_shares_one_session(self, mock_open, mock_makedirs, mock_session_class):
+        """
+        Test that run fetches chunks on worker threads through a single requests.Session.
+        """
+        # Arrange
+        def cmr_response(url, data, timeout):
+            doi = data[0][1]
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = {"items": [{
+                "meta": {"concept-id": f"C-{doi}"},
+                "umm": {"DOI": {"DOI": doi}, "DataCenters": [{"ShortName": "TEST_CENTER"}]}
+            }]}
+            return response
+
+        mock_session_class.return_value.post.side_effect = cmr_response
+        dois = ["10.5067/A", "10.5067/B", "10.5067/C"]
+        fetcher = MetadataFetcher(self.setup_mock_config())
+
+        # Act
+        with patch.object(fetcher, 'load_dataframe', return_value={"DOI_NAME": dois}):
+            fetcher.run()
+
+        # Assert
+        mock_session_class.assert_called_once()
+        assert mock_session_class.return_value.post.call_count == len(dois)
+        # One metadata file per DOI, then the cache index
+        assert mock_open.call_count == len(dois) + 1
+        assert mock_open.call_args.args[0] == "/mock/data/dir_cmr_cache_index.json"
+        assert fetcher.success_count == len(dois)
+        assert fetcher.failure_count == 0
+
+    @patch('requests.Session')
+    @patch('os.makedirs')
+    @patch('builtins.open', new_callable=mock_open)
+    def test_run_counts_blank_doi_as_failure(self, mock_open, mock_makedirs, mock_session_class):
+        """
+        Test that a blank DOI cell, read by pandas as NaN, is counted as a failure and the run completes.
+        """
+        # Arrange
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"items": [{
+            "meta": {"concept-id": "C-A"},
+            "umm": {"DOI": {"DOI": "10.5067/A"}, "DataCenters": [{"ShortName": "TEST_CENTER"}]}
+        }]}
+        mock_session_class.return_value.post.return_value = mock_response
+        fetcher = MetadataFetcher(self.setup_mock_config())
+
+        # Act
+        with patch.object(fetcher, 'load_dataframe', return_value=pd.DataFrame({"DOI_NAME": ["10.5067/A", float("nan")]})):
+            fetcher.run()
+
+        # Assert
+        assert fetcher.success_count == 1
+        assert fetcher.failure_count == 1
+        # Only the valid DOI is sent to CMR
+        assert mock_session_class.return_value.post.call_args.kwargs["data"][:-1] == [("doi[]", "10.5067/A")]
+        # The cache index is still saved once the run finishes
+        assert mock_open.call_args.args[0] == "/mock/data/dir_cmr_cache_index.json"
+
+    @patch('graph_ingest.ingest_scripts.get_collections_cmr.BULK_CHUNK_SIZE', 1)
+    @patch('requests.Session.post')
+    def test_fetch_metadata_bulk_malformed_doi_fails_own_chunk(self, mock_post):
+        """
+        Test that a malformed DOI only fails the bulk search for its own chunk.
+        """
+        # Arrange
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = copy.deepcopy(_CMR_SUCCESS_PAYLOAD)
+        mock_response.json.return_value["items"][0]["umm"]["DOI"] = {"DOI": "10.5067/A"}
+        mock_post.return_value = mock_response
+        fetcher = MetadataFetcher(self.setup_mock_config())
+
+        # Act
+        found = fetcher.fetch_metadata_bulk([float("nan"), "10.5067/A"])
+
+        # Assert
+        assert list(found) == ["10.5067/A"]
+        mock_post.assert_called_once()
+
+    @patch('requests.Session.get')
+    @patch('builtins.open', new_callable=mock_open)
+    def test_process_doi_timeout(self, mock_open, mock_get):
+        """
+        Test that process_doi sets a request timeout and treats a timed-out request as a failure.
+        """
+        # Arrange
+        mock_get.side_effect = requests.exceptions.Timeout("slow")
+        fetcher = MetadataFetcher(self.setup_mock_config())
+
+        # Act
+        doi = "10.5067/IAGYM8QHCD5"
+        result = fetcher.process_doi(doi)
+
+        # Assert
+        assert result == (doi, False, False, "Unknown", False)
+        assert mock_get.call_args.kwargs["timeout"] == (5, 30)
+        mock_open.assert_not_called()
+
     @patch('graph_ingest.ingest_scripts.get_collections_cmr.MetadataFetcher')
     @patch('graph_ingest.ingest_scripts.get_collections_cmr.load_config')
     @patch('graph_ingest.ingest_scripts.get_collections_cmr.setup_logger')
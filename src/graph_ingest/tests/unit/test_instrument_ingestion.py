@@ -3,218 +3,205 @@
 import pytest
 import os
 import json
-import logging
-from unittest.mock import patch, MagicMock, mock_open, ANY, PropertyMock, call
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock, mock_open, ANY, PropertyMock, call, DEFAULT
 
+from graph_ingest.ingest_scripts import ingest_node_instrument as _mod
 from graph_ingest.ingest_scripts.ingest_node_instrument import InstrumentIngestor, main
 from graph_ingest.tests.fixtures.test_data import MOCK_INSTRUMENT
-from graph_ingest.tests.unit.base_test import BaseIngestorTest
 # Import the realistic instrument fixture
 from graph_ingest.tests.fixtures.generated_test_data import MOCK_INSTRUMENT as REALISTIC_INSTRUMENT
+from graph_ingest.tests.utils.mock_helpers import make_driver_mock
 
-class TestInstrumentIngestor(BaseIngestorTest):
+pytestmark = pytest.mark.xdist_group("instrument")
+
+# Properties of the realistic instrument fixture
+_INSTRUMENT_PROPS = REALISTIC_INSTRUMENT['properties']
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patched_env(mock_config):
+    """Patch load_config, setup_logger, get_driver and os.makedirs once for the module.
+
+    Yields:
+        SimpleNamespace of the four mocks plus ``session``, the session mock the
+        driver's session() context yields. get_driver returns a driver built once by
+        make_driver_mock, and setup_logger keeps its default return value; these become
+        the driver and logger of every ingestor.
+    """
+    mock_driver, mock_session = make_driver_mock()
+    with ExitStack() as stack:
+        mocks = stack.enter_context(
+            patch.multiple(_mod, load_config=DEFAULT, setup_logger=DEFAULT, get_driver=DEFAULT)
+        )
+        mocks["makedirs"] = stack.enter_context(patch('os.makedirs'))
+        mocks["load_config"].return_value = mock_config
+        mocks["get_driver"].return_value = mock_driver
+        yield SimpleNamespace(session=mock_session, **mocks)
+
+
+@pytest.fixture(autouse=True)
+def _reset_env(_patched_env):
+    """Clear calls recorded by the previous test; configured return values are kept.
+
+    reset_mock also clears the driver and logger mocks the patched factories return.
+    Tests read the shared session chain rather than reconfigure it, so nothing they
+    set on it outlives them.
+    """
+    for mock in vars(_patched_env).values():
+        mock.reset_mock()
+
+
+@pytest.fixture(scope="module")
+def ingestor(_patched_env):
+    """InstrumentIngestor built once for the module and shared by tests that do not mutate it."""
+    return InstrumentIngestor()
+
+
+class TestInstrumentIngestor:
     """Tests for the InstrumentIngestor class."""
 
-    def test_initialization(self):
+    def test_initialization(self, _patched_env, mock_config):
         """Test initialization of InstrumentIngestor."""
-        # Arrange
-        mock_config = self.setup_mock_config()
-        mock_logger = MagicMock(spec=logging.Logger)
-        mock_driver = MagicMock()
-        
-        # Apply patches
-        with patch('graph_ingest.ingest_scripts.ingest_node_instrument.setup_logger', return_value=mock_logger) as mock_setup_logger:
-            with patch('graph_ingest.ingest_scripts.ingest_node_instrument.load_config', return_value=mock_config):
-                with patch('os.makedirs') as mock_makedirs:
-                    with patch('graph_ingest.ingest_scripts.ingest_node_instrument.get_driver', return_value=mock_driver) as mock_get_driver:
-                        # Act
-                        ingestor = InstrumentIngestor()
-                        
-                        # Assert
-                        mock_makedirs.assert_called_once_with('/mock/log/dir', exist_ok=True)
-                        mock_setup_logger.assert_called_once()
-                        mock_get_driver.assert_called_once()
-                        assert ingestor.driver == mock_driver
-                        assert ingestor.logger == mock_logger
-                        assert ingestor.config == mock_config
-
-    def test_set_instrument_uniqueness_constraint(self):
+        # Act
+        ingestor = InstrumentIngestor()
+        
+        # Assert
+        _patched_env.makedirs.assert_called_once_with('/mock/log/dir', exist_ok=True)
+        _patched_env.setup_logger.assert_called_once()
+        _patched_env.get_driver.assert_called_once()
+        assert ingestor.driver is _patched_env.get_driver.return_value
+        assert ingestor.logger is _patched_env.setup_logger.return_value
+        assert ingestor.config == mock_config
+
+    def test_set_instrument_uniqueness_constraint(self, ingestor, _patched_env):
         """Test setting uniqueness constraint."""
         # Arrange
-        with patch('graph_ingest.ingest_scripts.ingest_node_instrument.load_config') as mock_load_config:
-            mock_config = self.setup_mock_config()
-            mock_load_config.return_value = mock_config
-            
-            with patch('os.makedirs'):
-                with patch('graph_ingest.ingest_scripts.ingest_node_instrument.setup_logger') as mock_setup_logger:
-                    with patch('graph_ingest.ingest_scripts.ingest_node_instrument.get_driver') as mock_get_driver:
-                        # Create mocks for the Neo4j driver chain
-                        mock_driver = MagicMock()
-                        mock_session = MagicMock()
-                        mock_logger = MagicMock()
-                        mock_setup_logger.return_value = mock_logger
-                        
-                        # Configure the mocks
-                        mock_get_driver.return_value = mock_driver
-                        mock_driver.session.return_value = mock_session
-                        mock_session.__enter__ = MagicMock(return_value=mock_session)
-                        mock_session.__exit__ = MagicMock(return_value=None)
-                        
-                        # Act
-                        ingestor = InstrumentIngestor()
-                        ingestor.set_instrument_uniqueness_constraint()
-                        
-                        # Assert
-                        mock_driver.session.assert_called()
-                        mock_session.run.assert_called_once_with(
-                            "CREATE CONSTRAINT FOR (i:Instrument) REQUIRE i.globalId IS UNIQUE"
-                        )
-                        mock_logger.info.assert_called_with("Uniqueness constraint on Instrument.globalId set successfully.")
-
-    @patch('graph_ingest.ingest_scripts.ingest_node_instrument.get_driver')
-    @patch('graph_ingest.ingest_scripts.ingest_node_instrument.setup_logger')
-    @patch('graph_ingest.ingest_scripts.ingest_node_instrument.load_config')
-    @patch('os.makedirs')
-    def test_generate_uuid_from_shortname(self, mock_makedirs, mock_load_config, mock_setup_logger, mock_get_driver):
-        """Test UUID generation from short name."""
-        # Arrange
-        mock_config = self.setup_mock_config()
-        mock_load_config.return_value = mock_config
-        mock_driver = MagicMock()
-        mock_get_driver.return_value = mock_driver
+        mock_driver = ingestor.driver
+        mock_session = _patched_env.session
+        mock_logger = ingestor.logger
         
         # Act
-        ingestor = InstrumentIngestor()
+        ingestor.set_instrument_uniqueness_constraint()
+        
+        # Assert
+        mock_driver.session.assert_called()
+        mock_session.run.assert_called_once_with(
+            "CREATE CONSTRAINT FOR (i:Instrument) REQUIRE i.globalId IS UNIQUE"
+        )
+        mock_logger.info.assert_called_with("Uniqueness constraint on Instrument.globalId set successfully.")
+
+    @pytest.mark.parametrize("shortname, expected_none", [
+        ("TEST_INSTRUMENT", False),
+        ("ANOTHER_INSTRUMENT", False),
+        ("", True),  # Empty string should return None
+    ], ids=["test_instrument", "another_instrument", "empty"])
+    def test_generate_uuid_from_shortname(self, ingestor, shortname, expected_none):
+        """Test that UUID generation returns None only for an invalid short name."""
+        # Act
+        result = ingestor.generate_uuid_from_shortname(shortname)
+        
+        # Assert
+        assert (result is None) is expected_none
+
+    def test_generate_uuid_deterministic(self, ingestor):
+        """Test that the same short name maps to the same UUID and different ones do not."""
+        # Act
         uuid1 = ingestor.generate_uuid_from_shortname("TEST_INSTRUMENT")
-        uuid2 = ingestor.generate_uuid_from_shortname("TEST_INSTRUMENT")  # Should be the same
-        uuid3 = ingestor.generate_uuid_from_shortname("ANOTHER_INSTRUMENT")  # Should be different
-        invalid_uuid = ingestor.generate_uuid_from_shortname("")  # Should be None
+        uuid2 = ingestor.generate_uuid_from_shortname("TEST_INSTRUMENT")
+        uuid3 = ingestor.generate_uuid_from_shortname("ANOTHER_INSTRUMENT")
         
         # Assert
-        assert uuid1 is not None
         assert uuid1 == uuid2  # Same input should produce same UUID
         assert uuid1 != uuid3  # Different input should produce different UUID
-        assert invalid_uuid is None  # Empty string should return None
 
-    @patch('graph_ingest.ingest_scripts.ingest_node_instrument.get_driver')
-    @patch('graph_ingest.ingest_scripts.ingest_node_instrument.setup_logger')
-    @patch('graph_ingest.ingest_scripts.ingest_node_instrument.load_config')
-    @patch('os.makedirs')
-    def test_create_instrument_node(self, mock_makedirs, mock_load_config, mock_setup_logger, mock_get_driver):
+    def test_create_instrument_node(self, ingestor):
         """Test creating an instrument node using realistic data."""
         # Arrange
-        mock_config = self.setup_mock_config()
-        mock_load_config.return_value = mock_config
-        mock_driver = MagicMock()
-        mock_get_driver.return_value = mock_driver
         mock_transaction = MagicMock()
         
         # Use the realistic instrument data from the sample
+        global_id, short_name, long_name = (
+            _INSTRUMENT_PROPS[key] for key in ('globalId', 'shortName', 'longName')
+        )
         instrument_data = {
-            "globalId": REALISTIC_INSTRUMENT['properties']['globalId'],
-            "shortName": REALISTIC_INSTRUMENT['properties']['shortName'],
-            "longName": REALISTIC_INSTRUMENT['properties']['longName']
+            "globalId": global_id,
+            "shortName": short_name,
+            "longName": long_name
         }
         
         # Act
-        ingestor = InstrumentIngestor()
         ingestor.create_instrument_node(mock_transaction, instrument_data)
         
         # Assert
         mock_transaction.run.assert_called_once()
         args, kwargs = mock_transaction.run.call_args
         assert "MERGE (i:Instrument {globalId: $globalId})" in args[0]
-        assert kwargs["globalId"] == REALISTIC_INSTRUMENT['properties']['globalId']
-        assert kwargs["shortName"] == REALISTIC_INSTRUMENT['properties']['shortName']
-        assert kwargs["longName"] == REALISTIC_INSTRUMENT['properties']['longName']
+        assert kwargs["globalId"] == global_id
+        assert kwargs["shortName"] == short_name
+        assert kwargs["longName"] == long_name
 
-    def test_process_json_files(self):
+    @patch.multiple('graph_ingest.ingest_scripts.ingest_node_instrument', find_json_files=DEFAULT, tqdm=DEFAULT)
+    @patch('json.load')
+    @patch('builtins.open', new_callable=mock_open)
+    def test_process_json_files(self, _mock_file, mock_json_load, ingestor, _patched_env, **mocks):
         """Test processing JSON files."""
         # Arrange
-        with patch('graph_ingest.ingest_scripts.ingest_node_instrument.load_config') as mock_load_config:
-            mock_config = self.setup_mock_config()
-            mock_load_config.return_value = mock_config
-            
-            with patch('os.makedirs'):
-                with patch('graph_ingest.ingest_scripts.ingest_node_instrument.setup_logger') as mock_setup_logger:
-                    with patch('graph_ingest.ingest_scripts.ingest_node_instrument.get_driver') as mock_get_driver:
-                        with patch('graph_ingest.ingest_scripts.ingest_node_instrument.find_json_files') as mock_find_json_files:
-                            with patch('builtins.open', new_callable=mock_open):
-                                with patch('json.load') as mock_json_load:
-                                    with patch('graph_ingest.ingest_scripts.ingest_node_instrument.tqdm') as mock_tqdm:
-                                        # Set up mocks
-                                        mock_driver = MagicMock()
-                                        mock_session = MagicMock()
-                                        mock_get_driver.return_value = mock_driver
-                                        mock_driver.session.return_value = mock_session
-                                        mock_session.__enter__ = MagicMock(return_value=mock_session)
-                                        mock_session.__exit__ = MagicMock(return_value=None)
-                                        mock_logger = MagicMock()
-                                        mock_setup_logger.return_value = mock_logger
-                                        
-                                        # Set up mocks for file processing
-                                        json_file_path = "/mock/data/dir/file1.json"
-                                        mock_find_json_files.return_value = [json_file_path]
-                                        
-                                        # Mock the JSON data structure
-                                        mock_json_data = {
-                                            "Platforms": [
-                                                {
-                                                    "ShortName": "Platform1",
-                                                    "Instruments": [
-                                                        {
-                                                            "ShortName": "Instrument1",
-                                                            "LongName": "Test Instrument 1"
-                                                        },
-                                                        {
-                                                            "ShortName": "Instrument2",
-                                                            "LongName": "Test Instrument 2"
-                                                        }
-                                                    ]
-                                                }
-                                            ]
-                                        }
-                                        mock_json_load.return_value = mock_json_data
-                                        
-                                        # Mock tqdm to simply return the input
-                                        mock_tqdm.side_effect = lambda x, **kwargs: x
-                                        
-                                        # Act
-                                        ingestor = InstrumentIngestor()
-                                        ingestor.process_json_files("/mock/data/dir")
-                                        
-                                        # Assert
-                                        mock_find_json_files.assert_called_once_with("/mock/data/dir")
-                                        mock_json_load.assert_called_once()
-                                        mock_session.execute_write.assert_called_once()
-                                        
-                                        # Verify logging messages
-                                        mock_logger.info.assert_has_calls([
-                                            call("Found 1 JSON files in directory: /mock/data/dir"),
-                                            call("Total instruments to process: 2"),
-                                            call("Processed batch of 2 instruments. Total created so far: 2"),
-                                            call("Total instruments created: 2")
-                                        ], any_order=False)
+        mock_session = _patched_env.session
+        mock_logger = ingestor.logger
+        
+        # Set up mocks for file processing
+        json_file_path = "/mock/data/dir/file1.json"
+        mocks['find_json_files'].return_value = [json_file_path]
+        
+        # Mock the JSON data structure
+        mock_json_data = {
+            "Platforms": [
+                {
+                    "ShortName": "Platform1",
+                    "Instruments": [
+                        {
+                            "ShortName": "Instrument1",
+                            "LongName": "Test Instrument 1"
+                        },
+                        {
+                            "ShortName": "Instrument2",
+                            "LongName": "Test Instrument 2"
+                        }
+                    ]
+                }
+            ]
+        }
+        mock_json_load.return_value = mock_json_data
+        
+        # Mock tqdm to simply return the input
+        mocks['tqdm'].side_effect = lambda x, **kwargs: x
+        
+        # Act
+        ingestor.process_json_files("/mock/data/dir")
+        
+        # Assert
+        mocks['find_json_files'].assert_called_once_with("/mock/data/dir")
+        mock_json_load.assert_called_once()
+        mock_session.execute_write.assert_called_once()
+        
+        # Verify logging messages
+        mock_logger.info.assert_has_calls([
+            call("Found 1 JSON files in directory: /mock/data/dir"),
+            call("Total instruments to process: 2"),
+            call("Processed batch of 2 instruments. Total created so far: 2"),
+            call("Total instruments created: 2")
+        ], any_order=False)
 
     @patch('graph_ingest.ingest_scripts.ingest_node_instrument.InstrumentIngestor.process_json_files')
     @patch('graph_ingest.ingest_scripts.ingest_node_instrument.InstrumentIngestor.set_instrument_uniqueness_constraint')
-    @patch('graph_ingest.ingest_scripts.ingest_node_instrument.get_driver')
-    @patch('graph_ingest.ingest_scripts.ingest_node_instrument.setup_logger')
-    @patch('graph_ingest.ingest_scripts.ingest_node_instrument.load_config')
-    @patch('os.makedirs')
-    def test_run(self, mock_makedirs, mock_load_config, mock_setup_logger, mock_get_driver,
-                mock_set_constraint, mock_process_files):
+    def test_run(self, mock_set_constraint, mock_process_files, ingestor):
         """Test the run method."""
         # Arrange
-        mock_config = self.setup_mock_config()
-        mock_load_config.return_value = mock_config
-        mock_driver = MagicMock()
-        mock_get_driver.return_value = mock_driver
-        mock_logger = MagicMock()
-        mock_setup_logger.return_value = mock_logger
+        mock_logger = ingestor.logger
         
         # Act
-        ingestor = InstrumentIngestor()
         ingestor.run()
         
         # Assert
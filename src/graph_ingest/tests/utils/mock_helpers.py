@@ -68,4 +68,16 @@ def setup_test_file_system(json_files):
     open_patch = patch_open_with_json_data(json_files)
     json_load_patch = patch_json_load_with_data(json_data_list)
 
-    return open_patch, json_load_patch 
\ No newline at end of file
+    return open_patch, json_load_patch 
+
+def make_driver_mock():
+    """
+    Builds a Neo4j driver mock whose session() context manager yields a session mock.
+
+    Returns:
+        tuple: (driver, session)
+    """
+    driver = MagicMock()
+    session = MagicMock()
+    driver.session.return_value.__enter__.return_value = session
+    return driver, session